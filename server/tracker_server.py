@@ -10,24 +10,73 @@ import socket
 import json
 import time
 import argparse
+import hmac
 import os
+import queue
 import re
+import signal
 import sys
 import threading
 import traceback
 import email.utils
-from datetime import datetime, date, timezone
+import functools
+import gzip
+import heapq
+import zlib
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date, timedelta, timezone
 from zoneinfo import ZoneInfo
 from pathlib import Path
 from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Force line-buffered output for real-time logging with tail -f
 sys.stdout.reconfigure(line_buffering=True)
 
 
+if HAS_ORJSON:
+    # orjson parses bytes directly and raises a json.JSONDecodeError subclass
+    json_loads = orjson.loads
+
+    def json_dumps(obj) -> bytes:
+        """Encode obj as compact UTF-8 JSON.
+
+        orjson refuses nesting deeper than 254 levels and integers outside
+        64 bits, which stdlib json accepts, so those fall back to it.
+        """
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    def json_dumps_indented(obj) -> bytes:
+        """Encode obj as UTF-8 JSON indented by two spaces (same fallback as json_dumps)."""
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            return json.dumps(obj, indent=2).encode('utf-8')
+else:
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        """Encode obj as compact UTF-8 JSON."""
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    def json_dumps_indented(obj) -> bytes:
+        """Encode obj as UTF-8 JSON indented by two spaces."""
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+
+@functools.lru_cache(maxsize=256)
 def format_timestamp(ts: int) -> str:
-    """Convert unix timestamp to readable format."""
+    """Convert unix timestamp to readable format (cached: packets within a second share it)."""
     return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S")
 
 
@@ -38,149 +87,343 @@ def format_position(lat: float, lon: float) -> str:
     return f"{abs(lat):.5f}°{lat_dir} {abs(lon):.5f}°{lon_dir}"
 
 
+_iso_second_cache: tuple[int, str] = (-1, "")
+
+
+def iso_for_second(sec: int) -> str:
+    """Return the local ISO string for a whole second, formatting each second once."""
+    global _iso_second_cache
+    cached_sec, iso = _iso_second_cache
+    if cached_sec != sec:
+        iso = datetime.fromtimestamp(sec).isoformat()
+        _iso_second_cache = (sec, iso)
+    return iso
+
+
+def now_with_iso() -> tuple[float, str]:
+    """Return the current time and its local ISO string from a single clock read.
+
+    The ISO string has one-second resolution and is formatted at most once per
+    second, so bursts of saves within the same second reuse it.
+    """
+    now = time.time()
+    return now, iso_for_second(int(now))
+
+
+_log_time_cache: tuple[int, str] = (-1, "")
+
+
 def log(msg: str) -> None:
-    """Print a message with local timestamp prefix."""
-    ts = datetime.now().strftime("%H:%M:%S")
+    """Print a message with local timestamp prefix (formatted at most once per second)."""
+    global _log_time_cache
+    sec = int(time.time())
+    cached_sec, ts = _log_time_cache
+    if cached_sec != sec:
+        ts = time.strftime("%H:%M:%S", time.localtime(sec))
+        _log_time_cache = (sec, ts)
     print(f"{ts} {msg}")
 
 
+_zoneinfo_cache: dict[str, ZoneInfo] = {}
+
+
+def get_zoneinfo(tz_name: str) -> ZoneInfo:
+    """Return the cached ZoneInfo for tz_name, falling back to Australia/Sydney if invalid."""
+    tz = _zoneinfo_cache.get(tz_name) if isinstance(tz_name, str) else None
+    if tz is None:
+        try:
+            tz = ZoneInfo(tz_name)
+        except Exception as e:
+            log(f"[WARNING] Invalid timezone '{tz_name}', using Australia/Sydney: {e}")
+            tz = ZoneInfo("Australia/Sydney")
+        if isinstance(tz_name, str):
+            _zoneinfo_cache[tz_name] = tz
+    return tz
+
+
+def log_traceback(tag: str, e: BaseException) -> None:
+    """Log the innermost frame and exception line of e's traceback.
+
+    Only that frame is formatted, so a persistent error in a background loop
+    doesn't build the whole traceback string on every pass.
+    """
+    for chunk in traceback.format_tb(e.__traceback__, limit=-1) + traceback.format_exception_only(type(e), e):
+        for tb_line in chunk.rstrip('\n').split('\n'):
+            log(f"[{tag}]   {tb_line}")
+
+
 def rotate_file(filepath: Path) -> Path | None:
     """Rotate a file to FILENAME.1, FILENAME.2, etc. Returns new path or None if file doesn't exist."""
     if not filepath.exists():
         return None
 
-    # Find the next available number
-    n = 1
-    while True:
-        new_path = filepath.parent / f"{filepath.name}.{n}"
-        if not new_path.exists():
-            break
-        n += 1
+    # Number after the highest existing rotation, found in one directory scan
+    prefix = filepath.name + "."
+    n = 0
+    with os.scandir(filepath.parent) as entries:
+        for entry in entries:
+            suffix = entry.name[len(prefix):]
+            if entry.name.startswith(prefix) and suffix.isdigit():
+                n = max(n, int(suffix))
+    new_path = filepath.parent / f"{prefix}{n + 1}"
 
     filepath.rename(new_path)
     log(f"Rotated {filepath} -> {new_path}")
     return new_path
 
 
+def write_json_atomic(path: Path, data, indent: int | None = 2, rotate: bool = False):
+    """Write data as JSON via a temp file and os.replace() so readers never see a partial file.
+
+    The document is encoded up front and written with a single write() call,
+    through the fast encoders for the compact and two-space forms. Pass
+    indent=None for compact output in machine-read files.
+
+    With rotate=True an existing file is kept via rotate_file(), but only
+    once the new document is encoded and on disk, so a failed save never
+    leaves the path missing.
+    """
+    if indent is None:
+        payload = json_dumps(data)
+    elif indent == 2:
+        payload = json_dumps_indented(data)
+    else:
+        payload = json.dumps(data, indent=indent).encode('utf-8')
+    tmp_file = path.with_suffix('.tmp')
+    with open(tmp_file, 'wb') as f:
+        f.write(payload)
+    if rotate:
+        rotate_file(path)
+    os.replace(tmp_file, path)
+
+
+# HTML tag pattern stripped from tracker string fields
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Largest tracker timestamp accepted (2106-02-07), so values stay well inside
+# what datetime can format and what the JSON encoders can represent
+_MAX_TRACKER_TS = 2**32 - 1
+
+# Keys kept by sanitize_tracker_packet(); anything else a client sends is dropped
+_TRACKER_PACKET_FIELDS = frozenset((
+    'id', 'role', 'ver', 'os', 'pwd', 'sq', 'ts', 'hdg', 'bat', 'sig', 'eid', 'hr',
+    'lat', 'lon', 'spd', 'bdr', 'hac', 'ast', 'chg', 'ps', 'stopped', 'auth_check',
+    'pos', 'flg',
+))
+
+
+def _sanitize_string(value, max_length: int = 64, default: str = "?") -> str:
+    """Sanitize a string value: strip HTML, limit length."""
+    if not isinstance(value, str):
+        value = str(value) if value is not None else default
+    # Strip HTML tags
+    if '<' in value:
+        value = _HTML_TAG_RE.sub('', value)
+    # Strip dangerous characters
+    value = value.replace('<', '').replace('>', '').replace('&', '').replace('"', '').replace("'", '')
+    # Limit length
+    return value[:max_length].strip() or default
+
+
+def _sanitize_int(value, default: int = 0, min_val: int = None, max_val: int = None) -> int:
+    """Sanitize an integer value."""
+    try:
+        if type(value) is int:
+            result = value
+        else:
+            result = int(value) if value is not None else default
+        if min_val is not None:
+            result = max(min_val, result)
+        if max_val is not None:
+            result = min(max_val, result)
+        return result
+    except (ValueError, TypeError, OverflowError):
+        return default
+
+
+def _sanitize_float(value, default: float = 0.0, min_val: float = None, max_val: float = None) -> float:
+    """Sanitize a float value."""
+    try:
+        if type(value) is float:
+            result = value
+        else:
+            result = float(value) if value is not None else default
+        if min_val is not None:
+            result = max(min_val, result)
+        if max_val is not None:
+            result = min(max_val, result)
+        return result
+    except (ValueError, TypeError, OverflowError):
+        return default
+
+
+def _sanitize_bool(value, default: bool = False) -> bool:
+    """Sanitize a boolean value."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.lower() in ('true', '1', 'yes')
+    try:
+        return bool(value)
+    except (ValueError, TypeError):
+        return default
+
+
+# Status flags kept per packet; trackers send a couple of booleans ("ps", "bo")
+_MAX_TRACKER_FLAGS = 16
+
+
+def _sanitize_flags(flags: dict) -> dict:
+    """Keep the scalar entries of a tracker flags object.
+
+    Nested values and integers outside 64 bits are dropped so every stored
+    position can be encoded; strings are sanitized like other string fields.
+    """
+    result = {}
+    for key, value in flags.items():
+        if len(result) >= _MAX_TRACKER_FLAGS:
+            break
+        if not isinstance(key, str) or len(key) > 16:
+            continue
+        if value is None or isinstance(value, (bool, float)):
+            result[key] = value
+        elif isinstance(value, int):
+            if -2**63 <= value < 2**63:
+                result[key] = value
+        elif isinstance(value, str):
+            result[key] = _sanitize_string(value, max_length=64, default='')
+    return result
+
+
 def sanitize_tracker_packet(packet: dict) -> dict:
-    """Sanitize tracker packet inputs to prevent HTML injection and ensure type safety.
+    """Sanitize tracker packet inputs in place to prevent HTML injection and ensure type safety.
 
     - String fields: Strip HTML tags, limit length
     - Numeric fields: Ensure they are numbers, use defaults if invalid
     - Boolean fields: Ensure they are booleans
-    """
-    # HTML tag pattern for stripping
-    html_tag_pattern = re.compile(r'<[^>]+>')
-
-    def sanitize_string(value, max_length: int = 64, default: str = "?") -> str:
-        """Sanitize a string value: strip HTML, limit length."""
-        if not isinstance(value, str):
-            value = str(value) if value is not None else default
-        # Strip HTML tags
-        value = html_tag_pattern.sub('', value)
-        # Strip dangerous characters
-        value = value.replace('<', '').replace('>', '').replace('&', '').replace('"', '').replace("'", '')
-        # Limit length
-        return value[:max_length].strip() or default
-
-    def sanitize_int(value, default: int = 0, min_val: int = None, max_val: int = None) -> int:
-        """Sanitize an integer value."""
-        try:
-            result = int(value) if value is not None else default
-            if min_val is not None:
-                result = max(min_val, result)
-            if max_val is not None:
-                result = min(max_val, result)
-            return result
-        except (ValueError, TypeError):
-            return default
-
-    def sanitize_float(value, default: float = 0.0, min_val: float = None, max_val: float = None) -> float:
-        """Sanitize a float value."""
-        try:
-            result = float(value) if value is not None else default
-            if min_val is not None:
-                result = max(min_val, result)
-            if max_val is not None:
-                result = min(max_val, result)
-            return result
-        except (ValueError, TypeError):
-            return default
-
-    def sanitize_bool(value, default: bool = False) -> bool:
-        """Sanitize a boolean value."""
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, str):
-            return value.lower() in ('true', '1', 'yes')
-        try:
-            return bool(value)
-        except (ValueError, TypeError):
-            return default
 
-    # Sanitize the packet in place
-    sanitized = {}
+    Unknown keys are removed and required fields are always set, so callers
+    can index them directly. Returns the same dict.
+    """
+    if not isinstance(packet, dict):
+        raise ValueError("tracker packet must be a JSON object")
+    for key in [key for key in packet if key not in _TRACKER_PACKET_FIELDS]:
+        del packet[key]
+    get = packet.get
 
     # String fields
-    sanitized['id'] = sanitize_string(packet.get('id'), max_length=32, default='???')
-    sanitized['role'] = sanitize_string(packet.get('role'), max_length=16, default='sailor')
-    sanitized['ver'] = sanitize_string(packet.get('ver'), max_length=64, default='?')
+    packet['id'] = _sanitize_string(get('id'), max_length=32, default='???')
+    packet['role'] = _sanitize_string(get('role'), max_length=16, default='sailor')
+    packet['ver'] = _sanitize_string(get('ver'), max_length=64, default='?')
     if 'os' in packet:
-        sanitized['os'] = sanitize_string(packet.get('os'), max_length=64, default='')
+        packet['os'] = _sanitize_string(get('os'), max_length=64, default='')
     if 'pwd' in packet:
-        sanitized['pwd'] = sanitize_string(packet.get('pwd'), max_length=64, default='')
+        packet['pwd'] = _sanitize_string(get('pwd'), max_length=64, default='')
 
     # Integer fields
-    sanitized['sq'] = sanitize_int(packet.get('sq'), default=0, min_val=0)
-    sanitized['ts'] = sanitize_int(packet.get('ts'), default=0, min_val=0)
-    sanitized['hdg'] = sanitize_int(packet.get('hdg'), default=0, min_val=0, max_val=360)
-    sanitized['bat'] = sanitize_int(packet.get('bat'), default=-1, min_val=-1, max_val=100)
-    sanitized['sig'] = sanitize_int(packet.get('sig'), default=-1, min_val=-1, max_val=4)
-    sanitized['eid'] = sanitize_int(packet.get('eid'), default=1, min_val=1)
-    if 'hr' in packet and packet.get('hr') is not None:
-        sanitized['hr'] = sanitize_int(packet.get('hr'), default=0, min_val=0, max_val=300)
+    packet['sq'] = _sanitize_int(get('sq'), default=0, min_val=0)
+    packet['ts'] = _sanitize_int(get('ts'), default=0, min_val=0, max_val=_MAX_TRACKER_TS)
+    packet['hdg'] = _sanitize_int(get('hdg'), default=0, min_val=0, max_val=360)
+    packet['bat'] = _sanitize_int(get('bat'), default=-1, min_val=-1, max_val=100)
+    packet['sig'] = _sanitize_int(get('sig'), default=-1, min_val=-1, max_val=4)
+    packet['eid'] = _sanitize_int(get('eid'), default=1, min_val=1)
+    if get('hr') is not None:
+        packet['hr'] = _sanitize_int(packet['hr'], default=0, min_val=0, max_val=300)
+    else:
+        packet.pop('hr', None)
 
     # Float fields
-    sanitized['lat'] = sanitize_float(packet.get('lat'), default=0.0, min_val=-90.0, max_val=90.0)
-    sanitized['lon'] = sanitize_float(packet.get('lon'), default=0.0, min_val=-180.0, max_val=180.0)
-    sanitized['spd'] = sanitize_float(packet.get('spd'), default=0.0, min_val=0.0, max_val=100.0)
-    if 'bdr' in packet and packet.get('bdr') is not None:
-        sanitized['bdr'] = sanitize_float(packet.get('bdr'), default=0.0, min_val=0.0, max_val=100.0)
-    if 'hac' in packet and packet.get('hac') is not None:
-        sanitized['hac'] = sanitize_float(packet.get('hac'), default=0.0, min_val=0.0, max_val=10000.0)
+    packet['lat'] = _sanitize_float(get('lat'), default=0.0, min_val=-90.0, max_val=90.0)
+    packet['lon'] = _sanitize_float(get('lon'), default=0.0, min_val=-180.0, max_val=180.0)
+    packet['spd'] = _sanitize_float(get('spd'), default=0.0, min_val=0.0, max_val=100.0)
+    if get('bdr') is not None:
+        packet['bdr'] = _sanitize_float(packet['bdr'], default=0.0, min_val=0.0, max_val=100.0)
+    else:
+        packet.pop('bdr', None)
+    if get('hac') is not None:
+        packet['hac'] = _sanitize_float(packet['hac'], default=0.0, min_val=0.0, max_val=10000.0)
+    else:
+        packet.pop('hac', None)
 
     # Boolean fields
-    sanitized['ast'] = sanitize_bool(packet.get('ast'), default=False)
-    if 'chg' in packet:
-        sanitized['chg'] = sanitize_bool(packet.get('chg'), default=False)
-    if 'ps' in packet:
-        sanitized['ps'] = sanitize_bool(packet.get('ps'), default=False)
-    if 'stopped' in packet:
-        sanitized['stopped'] = sanitize_bool(packet.get('stopped'), default=False)
-
-    # Pass through pos array (1Hz mode) with sanitized values
+    packet['ast'] = _sanitize_bool(get('ast'), default=False)
+    for key in ('chg', 'ps', 'stopped', 'auth_check'):
+        if key in packet:
+            packet[key] = _sanitize_bool(packet[key], default=False)
+
+    # Sanitize pos array (1Hz mode) values
     # Format: [[ts, lat, lon], ...] or [[ts, lat, lon, spd], ...]
-    if 'pos' in packet and isinstance(packet.get('pos'), list):
+    # Samples are stored as tuples: smaller than lists, immutable so the
+    # position tail can share them, and still encoded as JSON arrays
+    pos_list = get('pos')
+    if isinstance(pos_list, list):
         sanitized_pos = []
-        for pos in packet['pos'][:100]:  # Limit to 100 positions
+        for pos in pos_list[:100]:  # Limit to 100 positions
             if isinstance(pos, list) and len(pos) >= 3:
-                entry = [
-                    sanitize_int(pos[0], default=0, min_val=0),  # timestamp
-                    sanitize_float(pos[1], default=0.0, min_val=-90.0, max_val=90.0),  # lat
-                    sanitize_float(pos[2], default=0.0, min_val=-180.0, max_val=180.0)  # lon
-                ]
+                sample_ts = _sanitize_int(pos[0], default=0, min_val=0, max_val=_MAX_TRACKER_TS)
+                sample_lat = _sanitize_float(pos[1], default=0.0, min_val=-90.0, max_val=90.0)
+                sample_lon = _sanitize_float(pos[2], default=0.0, min_val=-180.0, max_val=180.0)
                 # Include speed if present (4th element)
                 if len(pos) >= 4:
-                    entry.append(sanitize_float(pos[3], default=0.0, min_val=0.0, max_val=100.0))  # spd in knots
-                sanitized_pos.append(entry)
+                    sample_spd = _sanitize_float(pos[3], default=0.0, min_val=0.0, max_val=100.0)  # spd in knots
+                    sanitized_pos.append((sample_ts, sample_lat, sample_lon, sample_spd))
+                else:
+                    sanitized_pos.append((sample_ts, sample_lat, sample_lon))
         if sanitized_pos:
-            sanitized['pos'] = sanitized_pos
+            packet['pos'] = sanitized_pos
+        else:
+            del packet['pos']
+    elif 'pos' in packet:
+        del packet['pos']
+
+    # Status flags: keep a flat object of scalars
+    if 'flg' in packet:
+        if isinstance(packet['flg'], dict):
+            packet['flg'] = _sanitize_flags(packet['flg'])
+        else:
+            del packet['flg']
+
+    return packet
 
-    # Pass through flags dict if present
-    if 'flg' in packet and isinstance(packet.get('flg'), dict):
-        sanitized['flg'] = packet['flg']
 
-    return sanitized
+def encode_password(password) -> bytes | None:
+    """Encode a stored password for password_matches(); None if it can never match."""
+    if not isinstance(password, str):
+        return None
+    return password.encode('utf-8')
+
+
+def password_matches(supplied: str, expected: bytes | None) -> bool:
+    """Compare a supplied password against a pre-encoded one in constant time."""
+    if expected is None:
+        return False
+    return hmac.compare_digest(supplied.encode('utf-8'), expected)
+
+
+def encode_ack_suffix(event_name: str | None = None, assist_enabled: bool = True) -> bytes:
+    """Encode the constant tail of a tracker ACK (everything after "ts")."""
+    suffix = b''
+    if event_name:
+        suffix += b',"event":' + json_dumps(event_name)
+    if not assist_enabled:
+        suffix += b',"assist":false'
+    return suffix + b'}'
+
+
+_PLAIN_ACK_SUFFIX = encode_ack_suffix()
+
+
+def encode_ack(seq: int, ts: int, suffix: bytes = _PLAIN_ACK_SUFFIX) -> bytes:
+    """Encode a successful tracker ACK; only seq and ts are formatted per packet."""
+    return b'{"ack":%d,"ts":%d%s' % (seq, ts, suffix)
+
+
+# Error ACKs, formatted with (seq, ts) or (seq, ts, eid)
+_ACK_AUTH_INVALID = b'{"ack":%d,"ts":%d,"error":"auth","msg":"Invalid password"}'
+_ACK_AUTH_RATE_LIMITED = b'{"ack":%d,"ts":%d,"error":"auth","msg":"Too many attempts"}'
+_ACK_EVENT_NOT_FOUND = b'{"ack":%d,"ts":%d,"error":"event","msg":"Event %d not found"}'
+_ACK_EVENT_ARCHIVED = b'{"ack":%d,"ts":%d,"error":"event","msg":"Event %d is archived"}'
+_ACK_TRACKER_UNAVAILABLE = b'{"ack":%d,"ts":%d,"error":"server","msg":"Could not initialize event tracker"}'
 
 
 def get_course_timestamp(course_path: Path) -> float | None:
@@ -199,32 +442,46 @@ def get_course_timestamp(course_path: Path) -> float | None:
         return None
 
 
-def find_applicable_course(event_dir: Path, log_end_ts: float) -> tuple[str, float] | None:
+# course.json and its rotations (course.json.1, course.json.2, ...)
+_COURSE_FILE_RE = re.compile(r'^course\.json(?:\.(\d+))?$')
+
+
+def list_course_timestamps(event_dir: Path) -> list[tuple[str, float]]:
+    """Return (course_filename, updated_ts) for course.json and its rotations.
+
+    The directory is scanned once; the list is ordered course.json first,
+    then rotations by number.
+    """
+    found = []
+    try:
+        with os.scandir(event_dir) as entries:
+            for entry in entries:
+                match = _COURSE_FILE_RE.match(entry.name)
+                if match:
+                    found.append((int(match.group(1) or 0), entry.name, Path(entry.path)))
+    except FileNotFoundError:
+        return []
+    course_files = []
+    for _, name, path in sorted(found):
+        ts = get_course_timestamp(path)
+        if ts is not None:
+            course_files.append((name, ts))
+    return course_files
+
+
+def find_applicable_course(event_dir: Path, log_end_ts: float,
+                           course_files: list[tuple[str, float]] | None = None) -> tuple[str, float] | None:
     """Find the course file that was active at log_end_ts.
 
-    Scans course.json and rotated versions (course.json.1, course.json.2, etc.)
+    Considers course.json and rotated versions (course.json.1, course.json.2, etc.)
     and returns the one with the latest 'updated' timestamp that is <= log_end_ts.
+    Pass course_files from list_course_timestamps() to reuse one scan for
+    several lookups.
 
     Returns (course_filename, updated_ts) or None if no applicable course.
     """
-    course_files = []
-
-    # Check main course.json
-    base = event_dir / "course.json"
-    if base.exists():
-        ts = get_course_timestamp(base)
-        if ts is not None:
-            course_files.append((base.name, ts))
-
-    # Check rotated versions (course.json.1, course.json.2, ...)
-    for i in range(1, 100):
-        rotated = event_dir / f"course.json.{i}"
-        if rotated.exists():
-            ts = get_course_timestamp(rotated)
-            if ts is not None:
-                course_files.append((rotated.name, ts))
-        else:
-            break
+    if course_files is None:
+        course_files = list_course_timestamps(event_dir)
 
     if not course_files:
         return None
@@ -238,6 +495,15 @@ def find_applicable_course(event_dir: Path, log_end_ts: float) -> tuple[str, flo
     return None
 
 
+# Daily track log names: YYYY_MM_DD.jsonl or a rotation YYYY_MM_DD.jsonl.N
+_LOG_FILE_RE = re.compile(r'^(\d{4}_\d{2}_\d{2})\.jsonl(\.(\d+))?$')
+_SUMMARY_SUFFIX = '_summary.json'
+
+# Leading "id" and "ts" of a line written by build_track_entry(); lines that
+# don't match (older logs, escaped ids) fall back to a full JSON parse
+_LOG_LINE_HEAD_RE = re.compile(rb'\{"id":"([^"\\]*)","ts":(\d+)[,}]')
+
+
 def generate_log_summaries(log_dir: Path) -> int:
     """
     Generate summary JSON files for each day's logs.
@@ -249,62 +515,66 @@ def generate_log_summaries(log_dir: Path) -> int:
 
     Returns the number of summaries generated/updated.
     """
-    import re
-    from collections import defaultdict
-
     if not log_dir.exists():
         return 0
 
-    # Find all log files grouped by date
-    # Pattern: YYYY_MM_DD.jsonl or YYYY_MM_DD.jsonl.N
-    date_pattern = re.compile(r'^(\d{4}_\d{2}_\d{2})\.jsonl(\.(\d+))?$')
-
-    # Group files by date
-    date_files: dict[str, list[Path]] = defaultdict(list)
-    for f in log_dir.iterdir():
-        match = date_pattern.match(f.name)
-        if match:
-            date_str = match.group(1)
-            date_files[date_str].append(f)
+    # One directory scan groups the log files by date and collects their
+    # rotation index and mtime, plus the mtimes of the existing summaries,
+    # with one name match and one stat per file
+    date_files: dict[str, list[tuple[Path, float, int]]] = defaultdict(list)
+    summary_mtimes: dict[str, float] = {}
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            match = _LOG_FILE_RE.match(name)
+            if match:
+                rotation_idx = int(match.group(3)) if match.group(3) else 0
+                date_files[match.group(1)].append((Path(entry.path), entry.stat().st_mtime, rotation_idx))
+            elif name.endswith(_SUMMARY_SUFFIX):
+                summary_mtimes[name[:-len(_SUMMARY_SUFFIX)]] = entry.stat().st_mtime
 
     updated_count = 0
+    # Course files are read only if some summary needs regenerating, then reused
+    event_dir = log_dir.parent
+    course_files = None
 
     for date_str, log_files in date_files.items():
-        summary_file = log_dir / f"{date_str}_summary.json"
+        summary_file = log_dir / f"{date_str}{_SUMMARY_SUFFIX}"
 
         # Check if regeneration is needed (any log file newer than summary)
-        summary_mtime = summary_file.stat().st_mtime if summary_file.exists() else 0
-        log_mtimes = [f.stat().st_mtime for f in log_files]
-        newest_log_mtime = max(log_mtimes) if log_mtimes else 0
+        summary_mtime = summary_mtimes.get(date_str)
+        newest_log_mtime = max(mtime for _, mtime, _ in log_files)
 
-        if summary_mtime >= newest_log_mtime and summary_file.exists():
+        if summary_mtime is not None and summary_mtime >= newest_log_mtime:
             # Summary is up to date
             continue
 
         # Generate summary for this date
         logs_data = []
 
-        for log_file in sorted(log_files, key=lambda f: f.name):
-            # Parse rotation index from filename
-            match = date_pattern.match(log_file.name)
-            rotation_idx = int(match.group(3)) if match.group(3) else 0
-
+        for log_file, _, rotation_idx in sorted(log_files, key=lambda f: f[0].name):
             # Scan the log file
             start_ts = None
             end_ts = None
             point_count = 0
-            sailors: dict[str, dict] = {}  # id -> {points, first_ts, last_ts}
+            sailors: dict[str, list] = {}  # id -> [points, first_ts, last_ts]
 
             try:
-                with open(log_file, 'r') as f:
+                match_head = _LOG_LINE_HEAD_RE.match
+                with open(log_file, 'rb', buffering=1 << 20) as f:
                     for line in f:
                         line = line.strip()
                         if not line:
                             continue
                         try:
-                            entry = json.loads(line)
-                            ts = entry.get('ts')
-                            sailor_id = entry.get('id')
+                            head = match_head(line)
+                            if head:
+                                sailor_id = head.group(1).decode('utf-8')
+                                ts = int(head.group(2))
+                            else:
+                                entry = json_loads(line)
+                                ts = entry.get('ts')
+                                sailor_id = entry.get('id')
 
                             if ts is None or sailor_id is None:
                                 continue
@@ -316,20 +586,18 @@ def generate_log_summaries(log_dir: Path) -> int:
                             if end_ts is None or ts > end_ts:
                                 end_ts = ts
 
-                            if sailor_id not in sailors:
-                                sailors[sailor_id] = {
-                                    'points': 0,
-                                    'first_ts': ts,
-                                    'last_ts': ts
-                                }
-
-                            sailors[sailor_id]['points'] += 1
-                            if ts < sailors[sailor_id]['first_ts']:
-                                sailors[sailor_id]['first_ts'] = ts
-                            if ts > sailors[sailor_id]['last_ts']:
-                                sailors[sailor_id]['last_ts'] = ts
-
-                        except json.JSONDecodeError:
+                            # One dict lookup per line; counters live in a small list
+                            stats = sailors.get(sailor_id)
+                            if stats is None:
+                                sailors[sailor_id] = [1, ts, ts]
+                            else:
+                                stats[0] += 1
+                                if ts < stats[1]:
+                                    stats[1] = ts
+                                elif ts > stats[2]:
+                                    stats[2] = ts
+
+                        except (json.JSONDecodeError, UnicodeDecodeError):
                             continue
             except Exception as e:
                 log(f"[SUMMARY] Error reading {log_file}: {e}")
@@ -342,12 +610,16 @@ def generate_log_summaries(log_dir: Path) -> int:
                     'start_ts': start_ts,
                     'end_ts': end_ts,
                     'point_count': point_count,
-                    'sailors': sailors
+                    'sailors': {
+                        sailor_id: {'points': points, 'first_ts': first_ts, 'last_ts': last_ts}
+                        for sailor_id, (points, first_ts, last_ts) in sailors.items()
+                    }
                 }
 
                 # Find applicable course for this log segment
-                event_dir = log_dir.parent
-                course_info = find_applicable_course(event_dir, end_ts)
+                if course_files is None:
+                    course_files = list_course_timestamps(event_dir)
+                course_info = find_applicable_course(event_dir, end_ts, course_files)
                 if course_info:
                     log_entry['course'] = course_info[0]
                     log_entry['course_mtime'] = course_info[1]
@@ -358,7 +630,7 @@ def generate_log_summaries(log_dir: Path) -> int:
             continue
 
         # Preserve sublogs from existing summary if present
-        if summary_file.exists():
+        if summary_mtime is not None:
             try:
                 with open(summary_file, 'r') as f:
                     old_summary = json.load(f)
@@ -379,18 +651,16 @@ def generate_log_summaries(log_dir: Path) -> int:
         logs_data.sort(key=lambda x: x.get('start_ts', 0), reverse=True)
 
         # Write summary file
+        generated, generated_iso = now_with_iso()
         summary = {
             'date': date_str,
-            'generated': time.time(),
-            'generated_iso': datetime.now().isoformat(),
+            'generated': generated,
+            'generated_iso': generated_iso,
             'logs': logs_data
         }
 
         try:
-            tmp_file = summary_file.with_suffix('.tmp')
-            with open(tmp_file, 'w') as f:
-                json.dump(summary, f, indent=2)
-            tmp_file.rename(summary_file)
+            write_json_atomic(summary_file, summary)
             updated_count += 1
             total_points = sum(log['point_count'] for log in logs_data)
             log(f"[SUMMARY] Generated {summary_file.name}: {len(logs_data)} logs, {total_points} points")
@@ -400,18 +670,54 @@ def generate_log_summaries(log_dir: Path) -> int:
     return updated_count
 
 
+class EventPacketInfo:
+    """Per-event fields needed to accept a tracker packet, snapshotted on change."""
+
+    __slots__ = ('name', 'archived', 'assist_enabled', 'requires_tracker_password',
+                 'tracker_password_bytes', 'ack_suffix')
+
+    def __init__(self, eid: int, event: dict):
+        self.name = event.get('name', f'Event {eid}')
+        self.archived = bool(event.get('archived'))
+        self.assist_enabled = event.get('assist_enabled', True)
+        tracker_password = event.get('tracker_password', '')
+        self.requires_tracker_password = bool(tracker_password)
+        self.tracker_password_bytes = encode_password(tracker_password)
+        self.ack_suffix = encode_ack_suffix(self.name, self.assist_enabled)
+
+
 class EventManager:
     """Manages multiple events with their configurations and passwords."""
 
     def __init__(self, events_file: Path, html_dir: Path):
         self.events_file = events_file
         self.html_dir = html_dir
+        # Copy-on-write: changes build a new dict (and a new event dict) and
+        # rebind it under _lock, so readers use whatever they fetched lock-free
         self.events: dict[int, dict] = {}
+        # Encoded event list responses, each keyed by the events dict it was built from
+        self._public_events_json: tuple[dict | None, bytes] = (None, b"")
+        self._all_events_json: tuple[dict | None, bytes] = (None, b"")
+        # Pre-encoded admin and tracker passwords for constant-time comparison
+        self._admin_password_bytes: dict[int, bytes | None] = {}
+        # Copy-on-write snapshot read lock-free on the tracker packet path
+        self._packet_info: dict[int, EventPacketInfo] = {}
         self.manager_password: str = ""
         self.next_eid: int = 1
         self._lock = threading.Lock()
+        # Set when events are created or updated (wakes the midnight clearer)
+        self.events_changed = threading.Event()
         self._load_events()
 
+    @property
+    def manager_password(self) -> str:
+        return self._manager_password
+
+    @manager_password.setter
+    def manager_password(self, value: str):
+        self._manager_password = value
+        self.manager_password_bytes = encode_password(value)
+
     def _load_events(self):
         """Load events from JSON file."""
         if not self.events_file.exists():
@@ -429,6 +735,7 @@ class EventManager:
                 try:
                     eid = int(eid_str)
                     self.events[eid] = event
+                    self._cache_passwords(eid)
                 except ValueError:
                     log(f"[EVENTS] Skipping invalid event ID: {eid_str}")
             log(f"[EVENTS] Loaded {len(self.events)} events from {self.events_file}")
@@ -443,55 +750,82 @@ class EventManager:
             "events": {str(eid): event for eid, event in self.events.items()}
         }
         try:
-            tmp_file = self.events_file.with_suffix('.tmp')
-            with open(tmp_file, 'w') as f:
-                json.dump(output, f, indent=2)
-            tmp_file.rename(self.events_file)
+            write_json_atomic(self.events_file, output)
             log(f"[EVENTS] Saved {len(self.events)} events to {self.events_file}")
         except Exception as e:
             log(f"[EVENTS] Error saving events file: {e}")
 
+    def _cache_passwords(self, eid: int):
+        """Pre-encode an event's passwords after it is loaded or changed."""
+        event = self.events[eid]
+        self._admin_password_bytes[eid] = encode_password(event.get('admin_password', ''))
+        packet_info = dict(self._packet_info)
+        packet_info[eid] = EventPacketInfo(eid, event)
+        self._packet_info = packet_info
+
+    def get_admin_password_bytes(self, eid: int) -> bytes | None:
+        """Get the pre-encoded admin password for an event."""
+        return self._admin_password_bytes.get(eid)
+
+    def get_packet_info(self, eid: int) -> EventPacketInfo | None:
+        """Get the packet-path snapshot for an event (no lock taken)."""
+        return self._packet_info.get(eid)
+
     def get_event(self, eid: int) -> dict | None:
-        """Get event by ID."""
-        with self._lock:
-            return self.events.get(eid)
+        """Get event by ID (treat the returned dict as read-only)."""
+        return self.events.get(eid)
 
     def list_events(self) -> list[int]:
         """Get list of all event IDs."""
-        with self._lock:
-            return list(self.events.keys())
+        return list(self.events)
 
     def get_public_events(self) -> list[dict]:
         """Get list of active (non-archived) events without passwords."""
-        with self._lock:
-            result = []
-            for eid, event in self.events.items():
-                if not event.get('archived', False):
-                    result.append({
-                        "eid": eid,
-                        "name": event.get("name", f"Event {eid}"),
-                        "description": event.get("description", ""),
-                        "timezone": event.get("timezone", "Australia/Sydney"),
-                        "home_location": event.get("home_location", ""),
-                        "home_lat": event.get("home_lat"),
-                        "home_lon": event.get("home_lon")
-                    })
-            # Sort by name
-            result.sort(key=lambda e: e.get("name", ""))
-            return result
-
-    def get_all_events(self) -> list[dict]:
-        """Get list of all events with full details (for manager)."""
-        with self._lock:
-            result = []
-            for eid, event in self.events.items():
+        result = []
+        for eid, event in self.events.items():
+            if not event.get('archived', False):
                 result.append({
                     "eid": eid,
-                    **event
+                    "name": event.get("name", f"Event {eid}"),
+                    "description": event.get("description", ""),
+                    "timezone": event.get("timezone", "Australia/Sydney"),
+                    "home_location": event.get("home_location", ""),
+                    "home_lat": event.get("home_lat"),
+                    "home_lon": event.get("home_lon")
                 })
-            # Sort by eid
-            result.sort(key=lambda e: e.get("eid", 0))
-            return result
+        # Sort by name
+        result.sort(key=lambda e: e.get("name", ""))
+        return result
+
+    def get_all_events(self) -> list[dict]:
+        """Get list of all events with full details (for manager)."""
+        result = []
+        for eid, event in self.events.items():
+            result.append({
+                "eid": eid,
+                **event
+            })
+        # Sort by eid
+        result.sort(key=lambda e: e.get("eid", 0))
+        return result
+
+    def get_public_events_json(self) -> bytes:
+        """Get the encoded /api/events response, re-encoded only after events change."""
+        events = self.events
+        cached_events, payload = self._public_events_json
+        if cached_events is not events:
+            payload = json_dumps({"events": self.get_public_events()})
+            self._public_events_json = (events, payload)
+        return payload
+
+    def get_all_events_json(self) -> bytes:
+        """Get the encoded manager event list, re-encoded only after events change."""
+        events = self.events
+        cached_events, payload = self._all_events_json
+        if cached_events is not events:
+            payload = json_dumps({"events": self.get_all_events()})
+            self._all_events_json = (events, payload)
+        return payload
 
     def create_event(self, name: str, description: str,
                      admin_password: str, tracker_password: str = "",
@@ -502,7 +836,9 @@ class EventManager:
         with self._lock:
             eid = self.next_eid
             self.next_eid += 1
-            self.events[eid] = {
+            created, created_iso = now_with_iso()
+            events = dict(self.events)
+            events[eid] = {
                 "name": name,
                 "description": description,
                 "admin_password": admin_password,
@@ -513,10 +849,13 @@ class EventManager:
                 "home_lon": home_lon,
                 "archived": False,
                 "assist_enabled": True,  # Whether assist button is available to users
-                "created": time.time(),
-                "created_iso": datetime.now().isoformat()
+                "created": created,
+                "created_iso": created_iso
             }
+            self.events = events
+            self._cache_passwords(eid)
             self._save_events()
+            self.events_changed.set()
             # Create event data directory
             self._ensure_event_dir(eid)
             log(f"[EVENTS] Created event {eid}: {name} (timezone: {timezone}, location: {home_location})")
@@ -527,7 +866,7 @@ class EventManager:
         with self._lock:
             if eid not in self.events:
                 return False
-            event = self.events[eid]
+            event = dict(self.events[eid])
             # Only allow updating certain fields
             allowed_fields = ['name', 'description', 'archived', 'assist_enabled',
                               'admin_password', 'tracker_password', 'timezone',
@@ -535,9 +874,13 @@ class EventManager:
             for field in allowed_fields:
                 if field in updates:
                     event[field] = updates[field]
-            event['updated'] = time.time()
-            event['updated_iso'] = datetime.now().isoformat()
+            event['updated'], event['updated_iso'] = now_with_iso()
+            events = dict(self.events)
+            events[eid] = event
+            self.events = events
+            self._cache_passwords(eid)
             self._save_events()
+            self.events_changed.set()
             log(f"[EVENTS] Updated event {eid}: {updates}")
             return True
 
@@ -556,44 +899,84 @@ class EventManager:
         return event_dir
 
 
-def write_current_positions(positions: dict, positions_file: Path, user_overrides: dict | None = None, position_tails: dict | None = None):
-    """Write current positions to a JSON file for web UI consumption."""
+def write_current_positions(positions: dict, positions_file: Path, user_overrides: dict | None = None):
+    """Write current positions to a JSON file for web UI consumption.
+
+    Position dicts are never mutated once published, so sailors without a
+    display override are written as-is rather than copied.
+    """
     # Apply user overrides for display (name, role, hidden)
     display_positions = {}
     for sailor_id, pos in positions.items():
+        override = user_overrides.get(sailor_id) if user_overrides else None
+        if override is None:
+            display_positions[sailor_id] = pos
+            continue
         display_pos = pos.copy()
-        if user_overrides and sailor_id in user_overrides:
-            override = user_overrides[sailor_id]
-            if 'name' in override:
-                display_pos['name'] = override['name']
-            if 'role' in override:
-                display_pos['role'] = override['role']
-            if override.get('hidden'):
-                display_pos['hidden'] = True
-        # Add position tail if available (last 20 seconds of positions)
-        if position_tails and sailor_id in position_tails:
-            display_pos['tail'] = position_tails[sailor_id]
+        if 'name' in override:
+            display_pos['name'] = override['name']
+        if 'role' in override:
+            display_pos['role'] = override['role']
+        if override.get('hidden'):
+            display_pos['hidden'] = True
         display_positions[sailor_id] = display_pos
 
+    updated, updated_iso = now_with_iso()
     output = {
-        "updated": time.time(),
-        "updated_iso": datetime.now().isoformat(),
+        "updated": updated,
+        "updated_iso": updated_iso,
         "sailors": display_positions
     }
     # Write atomically to avoid partial reads
     # Use absolute paths to avoid issues when working directory differs
     try:
-        positions_file = positions_file.resolve()
-        tmp_file = positions_file.with_suffix('.tmp')
-        with open(tmp_file, 'w') as f:
-            json.dump(output, f, indent=2)
-        tmp_file.rename(positions_file)
+        write_json_atomic(positions_file.resolve(), output, indent=None)
     except OSError as e:
         log(f"[WARNING] Failed to write positions file: {e}")
 
 
+def build_track_entry(sailor_id: str, ts: int, recv_time: float, speed: float, heading: int,
+                      assist: bool, battery: int, signal: int, role: str, version: str, flags: dict,
+                      battery_drain_rate: float | None = None, heart_rate: int | None = None,
+                      os_version: str | None = None, horizontal_accuracy: float | None = None,
+                      lat: float = 0.0, lon: float = 0.0, pos_array: list | None = None) -> dict:
+    """Build a daily track log entry.
+
+    A 1Hz batch is logged as a single entry with its pos array
+    ([[ts, lat, lon], ...], more compact) in place of lat/lon.
+    """
+    if pos_array is None:
+        entry = {"id": sailor_id, "ts": ts, "recv_ts": recv_time, "lat": lat, "lon": lon,
+                 "spd": speed, "hdg": heading, "ast": assist, "bat": battery, "sig": signal,
+                 "role": role, "ver": version, "flg": flags}
+    else:
+        entry = {"id": sailor_id, "ts": ts, "recv_ts": recv_time, "pos": pos_array,
+                 "spd": speed, "hdg": heading, "ast": assist, "bat": battery, "sig": signal,
+                 "role": role, "ver": version, "flg": flags}
+    if battery_drain_rate is not None:
+        entry["bdr"] = battery_drain_rate
+    if heart_rate is not None and heart_rate > 0:
+        entry["hr"] = heart_rate
+    if os_version:
+        entry["os"] = os_version
+    if horizontal_accuracy is not None:
+        entry["hac"] = horizontal_accuracy
+    return entry
+
+
+# Daily track logs buffer up to this much between background flushes
+_DAILY_LOG_BUFFER_BYTES = 64 * 1024
+
+
 class DailyLogger:
-    """Handles daily log file rotation."""
+    """Handles daily log file rotation.
+
+    The day's file is opened by the first write, so idle events never create
+    one. Entries are buffered; the background writer flushes them shortly
+    after they are written rather than after every entry.
+    """
+
+    __slots__ = ('log_dir', 'current_date', 'log_fh', 'tz', '_lock', '_flush_pending')
 
     def __init__(self, log_dir: Path, tz_name: str = "Australia/Sydney"):
         self.log_dir = log_dir
@@ -601,12 +984,10 @@ class DailyLogger:
         self.current_date = None
         self.log_fh = None
         # Store timezone for date calculations
-        try:
-            self.tz = ZoneInfo(tz_name)
-        except Exception as e:
-            log(f"[WARNING] Invalid timezone '{tz_name}', using Australia/Sydney: {e}")
-            self.tz = ZoneInfo("Australia/Sydney")
-        self._open_log_for_today()
+        self.tz = get_zoneinfo(tz_name)
+        # Serializes writes against rotation and the background flush
+        self._lock = threading.Lock()
+        self._flush_pending = False
 
     def _get_log_filename(self, d: date) -> Path:
         return self.log_dir / f"{d.strftime('%Y_%m_%d')}.jsonl"
@@ -622,48 +1003,83 @@ class DailyLogger:
                 self.log_fh.close()
             self.current_date = today
             log_path = self._get_log_filename(today)
-            self.log_fh = open(log_path, 'a')
+            self.log_fh = open(log_path, 'ab', buffering=_DAILY_LOG_BUFFER_BYTES)
             log(f"Logging to: {log_path}")
 
     def write(self, entry: dict):
         """Write a log entry, rolling over at midnight if needed."""
-        self._open_log_for_today()
-        self.log_fh.write(json.dumps(entry) + "\n")
-        self.log_fh.flush()
+        line = json_dumps(entry) + b"\n"
+        with self._lock:
+            self._open_log_for_today()
+            self.log_fh.write(line)
+        if not self._flush_pending:
+            self._flush_pending = True
+            with _pending_writes_lock:
+                _pending_log_flushes.add(self)
+            _pending_writes_event.set()
+
+    def flush(self):
+        """Push buffered entries to the log file."""
+        self._flush_pending = False
+        with self._lock:
+            if self.log_fh:
+                self.log_fh.flush()
 
     def close(self):
-        if self.log_fh:
-            self.log_fh.close()
-            self.log_fh = None
+        with self._lock:
+            if self.log_fh:
+                self.log_fh.close()
+                self.log_fh = None
 
     def clear_today(self):
         """Clear today's log file by rotating it to .1, .2, etc."""
-        self._open_log_for_today()
-        if self.log_fh:
-            self.log_fh.close()
-            self.log_fh = None
-        log_path = self._get_log_filename(self._get_today_in_tz())
-        # Rotate the file instead of truncating
-        rotate_file(log_path)
-        # Open a fresh log file
-        self.log_fh = open(log_path, 'a')
+        with self._lock:
+            if self.log_fh:
+                self.log_fh.close()
+                self.log_fh = None
+            # Reopened lazily by the next write()
+            self.current_date = None
+            log_path = self._get_log_filename(self._get_today_in_tz())
+            # Rotate the file instead of truncating
+            rotate_file(log_path)
         log(f"Cleared track log: {log_path}")
 
 
+# Pending file writes, drained by run_background_writer():
+# trackers whose positions file needs rewriting, users.json snapshots to save,
+# and daily loggers holding unflushed entries
+_pending_position_writes: set["PositionTracker"] = set()
+_pending_user_saves: dict[Path, dict[str, dict]] = {}
+_pending_log_flushes: set["DailyLogger"] = set()
+_pending_writes_lock = threading.Lock()
+_pending_writes_event = threading.Event()
+_WRITE_FLUSH_INTERVAL = 0.5
+
+
 class PositionTracker:
     """Handles position tracking state and processing."""
 
     # How many seconds of position history to keep for tails
     TAIL_DURATION_SECONDS = 20
 
-    def __init__(self, positions_file: Path | None, daily_logger: DailyLogger | None):
+    __slots__ = ('positions_file', 'daily_logger', 'user_overrides', 'current_positions',
+                 'last_timestamp', '_lock', '_write_lock')
+
+    def __init__(self, positions_file: Path | None, daily_logger: DailyLogger | None,
+                 user_overrides: dict[str, dict] | None = None):
         self.positions_file = positions_file
         self.daily_logger = daily_logger
+        # Display overrides applied when writing the positions file (shared, mutated by admin API)
+        self.user_overrides = user_overrides if user_overrides is not None else {}
+        # current_positions is copy-on-write: updates build a new dict (and a new
+        # position dict) and rebind it, so readers can serialize a reference
+        # without copying. Each position carries its "tail": a list of
+        # (ts, lat, lon) for the last 20 seconds.
         self.current_positions: dict[str, dict] = {}
         self.last_timestamp: dict[str, int] = {}
-        # Position tails: sailor_id -> list of [ts, lat, lon] for last 20 seconds
-        self.position_tails: dict[str, list] = {}
         self._lock = threading.Lock()
+        # Serializes writes of the positions file (flush thread vs admin API)
+        self._write_lock = threading.Lock()
         # Load existing state from positions file if it exists
         self._load_from_file()
 
@@ -675,8 +1091,8 @@ class PositionTracker:
             positions_path = self.positions_file.resolve()
             if not positions_path.exists():
                 return
-            with open(positions_path, 'r') as f:
-                data = json.load(f)
+            with open(positions_path, 'rb') as f:
+                data = json_loads(f.read())
             sailors = data.get('sailors', {})
             if not sailors:
                 return
@@ -710,11 +1126,27 @@ class PositionTracker:
     def clear(self):
         """Clear all position state."""
         with self._lock:
-            self.current_positions.clear()
+            self.current_positions = {}
             self.last_timestamp.clear()
-            self.position_tails.clear()
         log("[ADMIN] Cleared internal position state")
 
+    def request_positions_write(self):
+        """Mark the positions file stale; the flush thread rewrites it shortly."""
+        if not self.positions_file:
+            return
+        with _pending_writes_lock:
+            _pending_position_writes.add(self)
+        _pending_writes_event.set()
+
+    def write_positions(self):
+        """Write the positions file now from a snapshot of the current state."""
+        if not self.positions_file:
+            return
+        with self._write_lock:
+            with self._lock:
+                positions = self.current_positions
+            write_current_positions(positions, self.positions_file, self.user_overrides)
+
     def process_position(self, sailor_id: str, lat: float, lon: float, speed: float,
                          heading: int, ts: int, assist: bool, battery: int, signal: int,
                          role: str, version: str, flags: dict, src_ip: str, source: str = "UDP",
@@ -730,19 +1162,66 @@ class PositionTracker:
         """
         recv_time = time.time()
 
+        # If stopped=True, clear any assist request
+        if stopped:
+            assist = False
+
+        # The duplicate check and the state update share one critical section,
+        # so two threads can't both accept the same timestamp
         with self._lock:
-            # Check for duplicate using timestamp
-            is_dup = False
-            if sailor_id in self.last_timestamp:
-                if ts <= self.last_timestamp[sailor_id]:
-                    is_dup = True
+            last_ts = self.last_timestamp.get(sailor_id)
+            is_dup = last_ts is not None and ts <= last_ts
 
+            # Update current positions (only if not a duplicate)
             if not is_dup:
                 self.last_timestamp[sailor_id] = ts
+                pos_data = {
+                    "id": sailor_id,
+                    "lat": lat,
+                    "lon": lon,
+                    "spd": speed,
+                    "hdg": heading,
+                    "ast": assist,
+                    "bat": battery,
+                    "sig": signal,
+                    "role": role,
+                    "ver": version,
+                    "flg": flags,
+                    "ts": ts,
+                    "last_seen": recv_time,
+                    "last_seen_iso": iso_for_second(int(recv_time)),
+                    "src_ip": src_ip
+                }
+                if battery_drain_rate is not None:
+                    pos_data["bdr"] = battery_drain_rate
+                if heart_rate is not None and heart_rate > 0:
+                    pos_data["hr"] = heart_rate
+                if os_version:
+                    pos_data["os"] = os_version
+                if horizontal_accuracy is not None:
+                    pos_data["hac"] = horizontal_accuracy
+                if stopped:
+                    pos_data["stopped"] = True
 
-        # If stopped=True, clear any assist request
-        if stopped:
-            assist = False
+                # Update position tail (last 20 seconds of positions), skipping
+                # anything older than TAIL_DURATION_SECONDS rather than copying it
+                cutoff_ts = ts - self.TAIL_DURATION_SECONDS
+                prev_pos = self.current_positions.get(sailor_id)
+                prev_tail = prev_pos.get("tail", ()) if prev_pos else ()
+                tail = [entry for entry in prev_tail if entry[0] >= cutoff_ts]
+                if pos_array and isinstance(pos_array, list):
+                    # In 1Hz mode, add the positions from the array inside the window;
+                    # (ts, lat, lon) samples are shared with pos_array rather than copied
+                    tail.extend(pos_entry[:3] for pos_entry in pos_array
+                                if len(pos_entry) >= 3 and pos_entry[0] >= cutoff_ts)
+                else:
+                    # Standard mode - just add current position
+                    tail.append((ts, lat, lon))
+                pos_data["tail"] = tail
+
+                positions = self.current_positions.copy()
+                positions[sailor_id] = pos_data
+                self.current_positions = positions
 
         # Format output
         dup_marker = " [DUP]" if is_dup else ""
@@ -751,7 +1230,7 @@ class PositionTracker:
         bat_str = f"{battery}%" if battery >= 0 else "?"
         sig_str = f"{signal}/4" if signal >= 0 else "?"
         hac_str = f" hac={horizontal_accuracy:.0f}m" if horizontal_accuracy is not None else ""
-        local_time = datetime.fromtimestamp(recv_time).strftime("%H:%M:%S")
+        local_time = format_timestamp(int(recv_time))[11:]  # HH:MM:SS
 
         log_line = (
             f"{local_time} [{sailor_id}] "
@@ -775,85 +1254,17 @@ class PositionTracker:
             log(f"!!! Position: {format_position(lat, lon)}")
             log("!" * 60)
 
-        # Update current positions (only if not a duplicate)
         if not is_dup:
-            with self._lock:
-                pos_data = {
-                    "id": sailor_id,
-                    "lat": lat,
-                    "lon": lon,
-                    "spd": speed,
-                    "hdg": heading,
-                    "ast": assist,
-                    "bat": battery,
-                    "sig": signal,
-                    "role": role,
-                    "ver": version,
-                    "flg": flags,
-                    "ts": ts,
-                    "last_seen": recv_time,
-                    "last_seen_iso": datetime.fromtimestamp(recv_time).isoformat(),
-                    "src_ip": src_ip
-                }
-                if battery_drain_rate is not None:
-                    pos_data["bdr"] = battery_drain_rate
-                if heart_rate is not None and heart_rate > 0:
-                    pos_data["hr"] = heart_rate
-                if os_version:
-                    pos_data["os"] = os_version
-                if horizontal_accuracy is not None:
-                    pos_data["hac"] = horizontal_accuracy
-                if stopped:
-                    pos_data["stopped"] = True
-                self.current_positions[sailor_id] = pos_data
-
-                # Update position tail (last 20 seconds of positions)
-                if sailor_id not in self.position_tails:
-                    self.position_tails[sailor_id] = []
-                tail = self.position_tails[sailor_id]
-                # In 1Hz mode, add all positions from the array
-                if pos_array and isinstance(pos_array, list) and len(pos_array) > 0:
-                    for pos_entry in pos_array:
-                        if len(pos_entry) >= 3:
-                            tail.append([pos_entry[0], pos_entry[1], pos_entry[2]])
-                else:
-                    # Standard mode - just add current position
-                    tail.append([ts, lat, lon])
-                # Remove positions older than TAIL_DURATION_SECONDS
-                cutoff_ts = ts - self.TAIL_DURATION_SECONDS
-                while tail and tail[0][0] < cutoff_ts:
-                    tail.pop(0)
+            # Schedule a rewrite of the current positions file
+            self.request_positions_write()
 
-            # Write current positions file
-            if self.positions_file:
-                write_current_positions(self.current_positions, self.positions_file, _user_overrides, self.position_tails)
-
-            # Write to daily track log (unless skip_log is True, e.g., for batch entries)
-            if self.daily_logger and not skip_log:
-                track_entry = {
-                    "id": sailor_id,
-                    "ts": ts,
-                    "recv_ts": recv_time,
-                    "lat": lat,
-                    "lon": lon,
-                    "spd": speed,
-                    "hdg": heading,
-                    "ast": assist,
-                    "bat": battery,
-                    "sig": signal,
-                    "role": role,
-                    "ver": version,
-                    "flg": flags
-                }
-                if battery_drain_rate is not None:
-                    track_entry["bdr"] = battery_drain_rate
-                if heart_rate is not None and heart_rate > 0:
-                    track_entry["hr"] = heart_rate
-                if os_version:
-                    track_entry["os"] = os_version
-                if horizontal_accuracy is not None:
-                    track_entry["hac"] = horizontal_accuracy
-                self.daily_logger.write(track_entry)
+            # Write to daily track log (unless skip_log is True, e.g., for batch entries).
+            # Batch packets were already logged by the caller, so test skip_log first.
+            if not skip_log and self.daily_logger:
+                self.daily_logger.write(build_track_entry(
+                    sailor_id, ts, recv_time, speed, heading, assist, battery, signal, role, version, flags,
+                    battery_drain_rate=battery_drain_rate, heart_rate=heart_rate, os_version=os_version,
+                    horizontal_accuracy=horizontal_accuracy, lat=lat, lon=lon))
 
         return not is_dup
 
@@ -861,6 +1272,9 @@ class PositionTracker:
 class EventTracker:
     """Per-event tracker wrapping PositionTracker, DailyLogger, and user overrides."""
 
+    __slots__ = ('eid', 'data_dir', 'event_config', 'positions_file', 'course_file', 'users_file',
+                 'log_dir', '_source_labels', 'daily_logger', 'user_overrides', 'position_tracker')
+
     def __init__(self, eid: int, data_dir: Path, event_config: dict):
         self.eid = eid
         self.data_dir = data_dir
@@ -869,11 +1283,10 @@ class EventTracker:
         self.course_file = data_dir / "course.json"
         self.users_file = data_dir / "users.json"
         self.log_dir = data_dir / "logs"
+        # Log source labels for the known packet sources, built once per event
+        self._source_labels = {src: f"[E{eid}]{src}" for src in ("UDP", "POST")}
 
-        # Ensure directories exist
-        self.log_dir.mkdir(parents=True, exist_ok=True)
-
-        # Create daily logger with event timezone
+        # Create daily logger (creates the log directory) with event timezone
         event_tz = event_config.get('timezone', 'Australia/Sydney')
         self.daily_logger = DailyLogger(self.log_dir, event_tz)
 
@@ -881,7 +1294,7 @@ class EventTracker:
         self.user_overrides = load_user_overrides(self.users_file)
 
         # Create position tracker
-        self.position_tracker = PositionTracker(self.positions_file, self.daily_logger)
+        self.position_tracker = PositionTracker(self.positions_file, self.daily_logger, self.user_overrides)
 
         # Ensure current_positions.json exists
         if not self.positions_file.exists():
@@ -902,33 +1315,13 @@ class EventTracker:
         # If 1Hz array format, log as single entry with pos array (more compact)
         has_batch = pos_array and isinstance(pos_array, list) and len(pos_array) > 1
         if has_batch and self.daily_logger:
-            track_entry = {
-                "id": sailor_id,
-                "ts": ts,
-                "recv_ts": recv_time,
-                "pos": pos_array,
-                "spd": speed,
-                "hdg": heading,
-                "ast": assist,
-                "bat": battery,
-                "sig": signal,
-                "role": role,
-                "ver": version,
-                "flg": flags
-            }
-            if battery_drain_rate is not None:
-                track_entry["bdr"] = battery_drain_rate
-            if heart_rate is not None and heart_rate > 0:
-                track_entry["hr"] = heart_rate
-            if os_version:
-                track_entry["os"] = os_version
-            if horizontal_accuracy is not None:
-                track_entry["hac"] = horizontal_accuracy
-            self.daily_logger.write(track_entry)
-
-        # Process through position tracker
-        # We pass user_overrides via the global for now (will refactor later)
-        result = self.position_tracker.process_position(
+            self.daily_logger.write(build_track_entry(
+                sailor_id, ts, recv_time, speed, heading, assist, battery, signal, role, version, flags,
+                battery_drain_rate=battery_drain_rate, heart_rate=heart_rate, os_version=os_version,
+                horizontal_accuracy=horizontal_accuracy, pos_array=pos_array))
+
+        # Process through position tracker (which also schedules the positions file write)
+        return self.position_tracker.process_position(
             sailor_id=sailor_id,
             lat=lat,
             lon=lon,
@@ -942,7 +1335,7 @@ class EventTracker:
             version=version,
             flags=flags,
             src_ip=src_ip,
-            source=f"[E{self.eid}]{source}",
+            source=self._source_labels.get(source) or f"[E{self.eid}]{source}",
             battery_drain_rate=battery_drain_rate,
             heart_rate=heart_rate,
             os_version=os_version,
@@ -952,17 +1345,6 @@ class EventTracker:
             pos_array=pos_array
         )
 
-        # Write positions with event-specific user overrides
-        if result and self.positions_file:
-            write_current_positions(
-                self.position_tracker.current_positions,
-                self.positions_file,
-                self.user_overrides,
-                self.position_tracker.position_tails
-            )
-
-        return result
-
     def clear_tracks(self):
         """Clear tracks for this event."""
         if self.daily_logger:
@@ -971,7 +1353,7 @@ class EventTracker:
             self.positions_file.unlink()
         self.position_tracker.clear()
         # Recreate empty positions file
-        write_current_positions({}, self.positions_file, self.user_overrides)
+        self.position_tracker.write_positions()
         log(f"[EVENT {self.eid}] Tracks cleared")
 
     def close(self):
@@ -983,54 +1365,96 @@ class EventTracker:
 # Global references for HTTP handler to access
 # Multi-event mode globals
 _event_manager: EventManager | None = None
-_event_trackers: dict[int, EventTracker] = {}  # eid -> EventTracker
+_event_trackers: dict[int, EventTracker] = {}  # eid -> EventTracker (copy-on-write)
 _event_trackers_lock = threading.Lock()
 
 # Legacy single-event mode globals (for backwards compatibility)
 _daily_logger: DailyLogger | None = None
 _position_tracker: PositionTracker | None = None
 _admin_password: str = "admin"
+_admin_password_bytes: bytes | None = b"admin"
 _tracker_password: str | None = None  # Password for UDP tracker packets (None = no password required)
+_tracker_password_bytes: bytes | None = None
 _course_file: Path | None = None
 _users_file: Path | None = None
 _user_overrides: dict[str, dict] = {}  # id -> {"name": "...", "role": "..."}
 
 # Rate limiting for password guessing protection
-# Maps IP address -> timestamp of last failed auth attempt
-_failed_auth_times: dict[str, float] = {}
-_RATE_LIMIT_SECONDS = 5.0
+# Token bucket per IP: ip -> (tokens, last update on the monotonic clock), least
+# recently updated first. Each failed auth spends a token and an IP with less
+# than one token left is rate limited. One token refilled every 5 seconds gives
+# one attempt per 5 seconds after a failure.
+# Lookups are a single dict get and take no lock; only failures, which come
+# from both the UDP worker and HTTP threads, serialize on _auth_buckets_lock.
+_auth_buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+_auth_buckets_lock = threading.Lock()
+_AUTH_BUCKET_CAPACITY = 1.0
+_AUTH_REFILL_PER_SECOND = 1.0 / 5.0
+_MAX_AUTH_BUCKETS = 4096
+
+
+def _auth_tokens(ip: str, now: float) -> float:
+    """Return the tokens an IP has available at monotonic time `now`."""
+    bucket = _auth_buckets.get(ip)
+    if bucket is None:
+        return _AUTH_BUCKET_CAPACITY
+    tokens, last = bucket
+    return min(_AUTH_BUCKET_CAPACITY, tokens + (now - last) * _AUTH_REFILL_PER_SECOND)
 
 
 def is_rate_limited(ip: str) -> bool:
     """Check if an IP is rate limited due to recent failed auth."""
-    if ip in _failed_auth_times:
-        elapsed = time.time() - _failed_auth_times[ip]
-        if elapsed < _RATE_LIMIT_SECONDS:
-            return True
-    return False
+    return _auth_tokens(ip, time.monotonic()) < 1.0
 
 
 def record_failed_auth(ip: str):
-    """Record a failed authentication attempt for rate limiting."""
-    _failed_auth_times[ip] = time.time()
+    """Record a failed authentication attempt for rate limiting.
+
+    Buckets that have refilled are equivalent to no entry, so they are dropped
+    from the front, and the table is capped so a scan from many addresses
+    can't grow it without bound.
+    """
+    with _auth_buckets_lock:
+        now = time.monotonic()
+        _auth_buckets[ip] = (max(0.0, _auth_tokens(ip, now) - 1.0), now)
+        _auth_buckets.move_to_end(ip)
+        while _auth_buckets:
+            tokens, last = next(iter(_auth_buckets.values()))
+            refilled = tokens + (now - last) * _AUTH_REFILL_PER_SECOND >= _AUTH_BUCKET_CAPACITY
+            if not refilled and len(_auth_buckets) <= _MAX_AUTH_BUCKETS:
+                break
+            _auth_buckets.popitem(last=False)
 
 
 def get_event_tracker(eid: int) -> EventTracker | None:
-    """Get or create an EventTracker for the given event ID."""
+    """Get or create an EventTracker for the given event ID.
+
+    _event_trackers is copy-on-write: lookups of an existing tracker take no
+    lock, and creation copies the dict under the lock and rebinds it.
+    """
     global _event_trackers
 
     if not _event_manager:
         return None
 
+    # Events are never deleted, so an existing tracker needs no event check
+    tracker = _event_trackers.get(eid)
+    if tracker is not None:
+        return tracker
+
     event = _event_manager.get_event(eid)
     if not event:
         return None
 
     with _event_trackers_lock:
-        if eid not in _event_trackers:
+        tracker = _event_trackers.get(eid)
+        if tracker is None:
             data_dir = _event_manager.get_event_data_dir(eid)
-            _event_trackers[eid] = EventTracker(eid, data_dir, event)
-        return _event_trackers[eid]
+            tracker = EventTracker(eid, data_dir, event)
+            trackers = _event_trackers.copy()
+            trackers[eid] = tracker
+            _event_trackers = trackers
+        return tracker
 
 
 def load_user_overrides(users_file: Path) -> dict[str, dict]:
@@ -1049,70 +1473,465 @@ def save_user_overrides(users_file: Path, overrides: dict[str, dict]):
     """Save user overrides to JSON file."""
     if not users_file:
         return
+    updated, updated_iso = now_with_iso()
     output = {
-        "updated": time.time(),
-        "updated_iso": datetime.now().isoformat(),
+        "updated": updated,
+        "updated_iso": updated_iso,
         "users": overrides
     }
-    tmp_file = users_file.with_suffix('.tmp')
-    with open(tmp_file, 'w') as f:
-        json.dump(output, f, indent=2)
-    tmp_file.rename(users_file)
+    write_json_atomic(users_file, output)
     log(f"[ADMIN] Saved user overrides: {len(overrides)} users")
 
 
+def request_user_overrides_save(users_file: Path | None, overrides: dict[str, dict]):
+    """Queue a save of user overrides for the background writer (latest snapshot wins)."""
+    if not users_file:
+        return
+    with _pending_writes_lock:
+        _pending_user_saves[users_file] = dict(overrides)
+    _pending_writes_event.set()
+
+
 _static_dir: Path | None = None
+# Resolved _static_dir with a trailing separator, for the directory traversal
+# check (without it a sibling such as html2/ would share the prefix)
+_static_root: str = ""
 _positions_file: Path | None = None
 
+# DER encoding of the CMS signedData content type OID (1.2.840.113549.1.7.2)
+_OID_CMS_SIGNED_DATA = bytes.fromhex('2a864886f70d010702')
+
+
+def _ber_header(buf: bytes, pos: int) -> tuple[int, int, int | None]:
+    """Parse the BER tag and length at pos.
+
+    Returns (tag, content_start, content_end), with content_end None for an
+    indefinite length. Raises ValueError if the header runs past the buffer.
+    """
+    if pos + 2 > len(buf):
+        raise ValueError("truncated BER header")
+    tag = buf[pos]
+    if tag & 0x1f == 0x1f:
+        raise ValueError("multi-byte BER tags not supported")
+    length = buf[pos + 1]
+    pos += 2
+    if length == 0x80:
+        if not tag & 0x20:
+            raise ValueError("indefinite length on primitive BER element")
+        return tag, pos, None
+    if length & 0x80:
+        n = length & 0x7f
+        if n > 4:
+            raise ValueError("BER length too large")
+        if pos + n > len(buf):
+            raise ValueError("truncated BER header")
+        length = int.from_bytes(buf[pos:pos + n], 'big')
+        pos += n
+    if pos + length > len(buf):
+        raise ValueError("truncated BER element")
+    return tag, pos, pos + length
+
+
+def _ber_skip(buf: bytes, pos: int) -> int:
+    """Return the offset just past the BER element at pos."""
+    _, start, end = _ber_header(buf, pos)
+    if end is not None:
+        return end
+    pos = start
+    while buf[pos:pos + 2] != b'\x00\x00':
+        pos = _ber_skip(buf, pos)
+    return pos + 2
+
+
+def _ber_octets(buf: bytes, pos: int) -> bytes:
+    """Return the value of the (possibly constructed) OCTET STRING at pos."""
+    tag, start, end = _ber_header(buf, pos)
+    if tag == 0x04:
+        return buf[start:end]
+    if tag != 0x24:
+        raise ValueError(f"expected OCTET STRING, got tag 0x{tag:02x}")
+    parts = []
+    pos = start
+    while (pos < end) if end is not None else (buf[pos:pos + 2] != b'\x00\x00'):
+        parts.append(_ber_octets(buf, pos))
+        pos = _ber_skip(buf, pos)
+    return b''.join(parts)
+
+
+def extract_cms_content(der: bytes) -> bytes:
+    """Return the signed content embedded in a CMS/PKCS#7 SignedData blob.
+
+    The signature is not verified (same as `openssl cms -verify -noverify`).
+    Raises ValueError if the blob is not attached SignedData.
+    """
+    tag, pos, _ = _ber_header(der, 0)               # ContentInfo ::= SEQUENCE
+    if tag != 0x30:
+        raise ValueError("not a CMS ContentInfo")
+    tag, start, end = _ber_header(der, pos)         # contentType OID
+    if tag != 0x06 or der[start:end] != _OID_CMS_SIGNED_DATA:
+        raise ValueError("not CMS SignedData")
+    tag, pos, _ = _ber_header(der, end)             # content [0] EXPLICIT
+    if tag != 0xa0:
+        raise ValueError("missing SignedData content")
+    tag, pos, _ = _ber_header(der, pos)             # SignedData ::= SEQUENCE
+    if tag != 0x30:
+        raise ValueError("malformed SignedData")
+    pos = _ber_skip(der, pos)                       # version
+    pos = _ber_skip(der, pos)                       # digestAlgorithms
+    tag, pos, encap_end = _ber_header(der, pos)     # encapContentInfo ::= SEQUENCE
+    if tag != 0x30:
+        raise ValueError("malformed encapContentInfo")
+    pos = _ber_skip(der, pos)                       # eContentType
+    if pos == encap_end or der[pos:pos + 2] == b'\x00\x00':
+        raise ValueError("detached CMS signature has no content")
+    tag, pos, _ = _ber_header(der, pos)             # eContent [0] EXPLICIT
+    if tag != 0xa0:
+        raise ValueError("malformed encapContentInfo")
+    return _ber_octets(der, pos)
+
+
+# Largest request body accepted. Tracker packets are well under 1 KiB and
+# courses and enrollment plists a few KiB; anything larger is refused with
+# 413 before it is read
+_MAX_REQUEST_BODY_BYTES = 1024 * 1024
+
+# Seconds an HTTP connection may sit idle before a request starts; clients
+# reconnect cheaply, but an idle connection pins a pool worker
+_HTTP_IDLE_TIMEOUT = 3.0
+
+# JSON responses larger than this are gzipped for clients that accept it
+_GZIP_MIN_BYTES = 1024
+
+# Static text assets up to this size are served gzipped to clients that accept
+# it. Compressed bodies are cached by (path, mtime_ns, size), least recently
+# used first, so hot pages are compressed once per change rather than per hit.
+_STATIC_GZIP_MAX_BYTES = 512 * 1024
+_STATIC_GZIP_TYPES = frozenset({
+    'text/html', 'text/css', 'application/javascript', 'application/json', 'image/svg+xml',
+})
+_static_gzip_cache: OrderedDict[tuple[str, int, int], bytes] = OrderedDict()
+_static_gzip_lock = threading.Lock()
+_MAX_STATIC_GZIP_ENTRIES = 64
+
+# HTTP Date header value, formatted at most once per second
+_http_date_cache: tuple[int, str] = (-1, "")
+
+# Precompiled request path patterns
+_EVENT_PATH_RE = re.compile(r'^/api/event/(\d+)(/.*)?$')
+_MANAGE_EVENT_PATH_RE = re.compile(r'^/api/manage/event/(\d+)$')
+_LOG_DATE_RE = re.compile(r'^(\d{4}_\d{2}_\d{2})\.jsonl')
+
+
+class BoundedThreadingHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer that services connections from a bounded worker pool.
+
+    The stock ThreadingHTTPServer spawns a new thread per connection, so a burst
+    of map clients and tracker POSTs can create an unbounded number of threads.
+    Connections beyond max_workers queue until a worker is free, and once
+    max_queued are waiting further connections get an immediate 503 so the
+    backlog (and the fds it holds) stays bounded.
+    """
+
+    daemon_threads = True
+
+    _BUSY_RESPONSE = (b"HTTP/1.1 503 Service Unavailable\r\n"
+                      b"Retry-After: 1\r\n"
+                      b"Content-Length: 0\r\n"
+                      b"Connection: close\r\n\r\n")
+
+    def __init__(self, server_address, handler_class, max_workers: int = 32, max_queued: int = 256):
+        super().__init__(server_address, handler_class)
+        self._max_workers = max_workers
+        self._max_connections = max_workers + max_queued
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="http")
+        self._connections = 0
+        self._connections_lock = threading.Lock()
+
+    def process_request(self, request, client_address):
+        """Hand the connection to a pool worker instead of starting a new thread."""
+        with self._connections_lock:
+            busy = self._connections >= self._max_connections
+            if not busy:
+                self._connections += 1
+        if busy:
+            self._reject_busy(request, client_address)
+            return
+        self._pool.submit(self._process_pooled, request, client_address)
+
+    def _reject_busy(self, request, client_address):
+        """Answer 503 and close without reading the request; trackers retry or fall back to UDP."""
+        log(f"[HTTP] Worker pool full, rejecting {client_address[0]}")
+        try:
+            request.sendall(self._BUSY_RESPONSE)
+        except OSError:
+            pass
+        self.shutdown_request(request)
+
+    def _process_pooled(self, request, client_address):
+        try:
+            self.process_request_thread(request, client_address)
+        finally:
+            with self._connections_lock:
+                self._connections -= 1
+
+    def is_saturated(self) -> bool:
+        """True when connections are queued waiting for a free worker.
+
+        Keep-alive connections hold a worker while idle, so handlers close
+        them instead of keeping them open when others are waiting.
+        """
+        return self._connections > self._max_workers
+
+    def server_close(self):
+        super().server_close()
+        self._pool.shutdown(wait=False)
+
+
+def _gzipped_static(f, path: str, stat_info: os.stat_result) -> bytes:
+    """Return the gzipped contents of an open static file, from cache if unchanged."""
+    key = (path, stat_info.st_mtime_ns, stat_info.st_size)
+    with _static_gzip_lock:
+        body = _static_gzip_cache.get(key)
+        if body is not None:
+            _static_gzip_cache.move_to_end(key)
+            return body
+    body = gzip.compress(f.read(), compresslevel=6)
+    with _static_gzip_lock:
+        _static_gzip_cache[key] = body
+        while len(_static_gzip_cache) > _MAX_STATIC_GZIP_ENTRIES:
+            _static_gzip_cache.popitem(last=False)
+    return body
+
+
+# TCP_CORK is Linux-only; elsewhere static files are sent uncorked
+_HAVE_TCP_CORK = hasattr(socket, 'TCP_CORK')
+
+_STATIC_CONTENT_TYPES = {
+    '.html': 'text/html',
+    '.css': 'text/css',
+    '.js': 'application/javascript',
+    '.json': 'application/json',
+    '.jsonl': 'application/jsonlines',
+    '.gz': 'application/gzip',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.svg': 'image/svg+xml',
+    '.ico': 'image/x-icon',
+}
+
 
 class AdminHTTPHandler(BaseHTTPRequestHandler):
     """HTTP handler for admin API endpoints and optional static file serving."""
-    
+
+    # Keep connections open between requests from polling map clients
+    protocol_version = "HTTP/1.1"
+    # Socket timeout while a request is in progress; the wait for a request to
+    # start is bounded separately by _HTTP_IDLE_TIMEOUT
+    timeout = 30
+    # Small JSON responses should not wait on Nagle's algorithm
+    disable_nagle_algorithm = True
+    # Response body to send in the same write as the headers
+    _coalesced_body = b""
+
     def log_message(self, format, *args):
         """Override to prefix with [HTTP]"""
         log(f"[HTTP] {args[0]}")
-    
+
+    def handle_one_request(self):
+        """Serve one request, dropping the connection if none starts promptly.
+
+        An idle keep-alive connection holds a pool worker while it waits, so
+        the wait for the next request line is kept short.
+        """
+        self.connection.settimeout(_HTTP_IDLE_TIMEOUT)
+        try:
+            self.rfile.peek(1)
+        except TimeoutError:
+            self.close_connection = True
+            return
+        self.connection.settimeout(self.timeout)
+        super().handle_one_request()
+
+    def parse_request(self) -> bool:
+        self._body_read = False
+        self._content_length = 0
+        if not super().parse_request():
+            return False
+        # Parse Content-Length once per request; handlers use self._content_length
+        try:
+            self._content_length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            self._content_length = -1
+        if self._content_length < 0:
+            self._content_length = 0
+            # The body length is unknown, so the connection can't be reused
+            self.close_connection = True
+            self.send_error(400, "Invalid Content-Length")
+            return False
+        if self._content_length > _MAX_REQUEST_BODY_BYTES:
+            # Refuse before reading; the body is left unread, so close afterwards
+            self.close_connection = True
+            self.send_error(413, "Request body too large")
+            return False
+        return True
+
+    def end_headers(self):
+        """Finish headers, closing the connection if it can't be reused.
+
+        An unread request body would be parsed as the next request, and an idle
+        keep-alive connection blocks queued clients when the worker pool is full.
+        """
+        if not self.close_connection:
+            unread_body = not self._body_read and self._content_length > 0
+            if unread_body or self.server.is_saturated():
+                self.send_header('Connection', 'close')
+        super().end_headers()
+
+    def flush_headers(self):
+        """Write the buffered headers, with any body queued by _end_headers_with_body()."""
+        body = self._coalesced_body
+        if body:
+            self._coalesced_body = b""
+            self._headers_buffer.append(body)
+        super().flush_headers()
+
+    def _end_headers_with_body(self, body: bytes):
+        """Finish headers and send them and a small in-memory body in one write.
+
+        With Nagle disabled, separate writes would go out as separate segments.
+        """
+        self._coalesced_body = body
+        self.end_headers()
+
+    def date_time_string(self, timestamp=None) -> str:
+        """Return the Date header for now, reusing the string within the same second."""
+        global _http_date_cache
+        if timestamp is not None:
+            return super().date_time_string(timestamp)
+        sec = int(time.time())
+        cached_sec, value = _http_date_cache
+        if cached_sec != sec:
+            value = email.utils.formatdate(sec, usegmt=True)
+            _http_date_cache = (sec, value)
+        return value
+
+    def _read_body(self) -> bytes:
+        """Read the request body according to Content-Length."""
+        self._body_read = True
+        return self.rfile.read(self._content_length)
+
+    def _accepts_gzip(self) -> bool:
+        """Check whether the client sent Accept-Encoding: gzip (and not q=0)."""
+        for coding in self.headers.get('Accept-Encoding', '').split(','):
+            name, _, params = coding.partition(';')
+            if name.strip().lower() == 'gzip':
+                _, _, qvalue = params.partition('q=')
+                try:
+                    return float(qvalue) > 0 if qvalue else True
+                except ValueError:
+                    return True
+        return False
+
     def _send_json(self, data: dict | list, status: int = 200):
-        """Send JSON response."""
+        """Send JSON response, gzipped when large and the client accepts it."""
+        self._send_json_bytes(json_dumps(data), status)
+
+    def _send_json_bytes(self, payload: bytes, status: int = 200):
+        """Send an already-encoded JSON response."""
+        gzipped = len(payload) > _GZIP_MIN_BYTES and self._accepts_gzip()
+        if gzipped:
+            # Level 1 is cheap and still compresses repetitive JSON several-fold
+            payload = gzip.compress(payload, compresslevel=1)
         self.send_response(status)
         self.send_header('Content-Type', 'application/json')
+        if gzipped:
+            self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Content-Length', str(len(payload)))
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Headers', 'X-Admin-Password, X-Manager-Password, Content-Type')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, PATCH, DELETE, OPTIONS')
-        self.end_headers()
-        self.wfile.write(json.dumps(data).encode('utf-8'))
+        self._end_headers_with_body(payload)
     
     def _send_file(self, filepath: Path, content_type: str):
-        """Send a static file with Last-Modified header and If-Modified-Since support."""
+        """Send a static file with Last-Modified/ETag headers and conditional GET support.
+
+        Small text assets go to gzip-capable clients compressed from a cache.
+        Anything else is sent with sendfile(2) where available, so large logs
+        are never read into memory. Size and mtime come from the open
+        file, so they match the bytes sent even when the compressor replaces
+        a .gz between requests.
+        """
         try:
-            stat_info = filepath.stat()
-            last_modified = email.utils.formatdate(stat_info.st_mtime, usegmt=True)
+            with open(filepath, 'rb') as f:
+                stat_info = os.fstat(f.fileno())
+
+                size = stat_info.st_size
+                compressible = content_type in _STATIC_GZIP_TYPES and size <= _STATIC_GZIP_MAX_BYTES
+                use_gzip = compressible and self._accepts_gzip()
+                # Validator from size and mtime; the gzipped representation gets its own
+                etag = f'"{stat_info.st_mtime_ns:x}-{size:x}{"-gz" if use_gzip else ""}"'
+
+                if self._not_modified(etag, stat_info.st_mtime):
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
 
-            # Check If-Modified-Since header for conditional GET
-            ims = self.headers.get('If-Modified-Since')
-            if ims:
+                gz_body = _gzipped_static(f, str(filepath), stat_info) if use_gzip else None
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                if compressible:
+                    self.send_header('Vary', 'Accept-Encoding')
+                if gz_body is not None:
+                    self.send_header('Content-Encoding', 'gzip')
+                self.send_header('ETag', etag)
+                self.send_header('Content-Length', str(size if gz_body is None else len(gz_body)))
+                self.send_header('Last-Modified', email.utils.formatdate(stat_info.st_mtime, usegmt=True))
+                self.send_header('Access-Control-Allow-Origin', '*')
+                if gz_body is not None:
+                    self._end_headers_with_body(gz_body)
+                    return
+                # Zero-copy from page cache to socket via sendfile(2); socket.sendfile
+                # falls back to plain send() on platforms without it. The headers
+                # are written as soon as they end, so cork first to let them share
+                # the first segment with the body.
+                sock = self.connection
+                if _HAVE_TCP_CORK:
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 1)
                 try:
-                    ims_time = email.utils.parsedate_to_datetime(ims)
-                    file_time = datetime.fromtimestamp(stat_info.st_mtime, tz=timezone.utc)
-                    if file_time <= ims_time:
-                        self.send_response(304)
-                        self.end_headers()
-                        return
-                except (ValueError, TypeError):
-                    pass  # Invalid date format, proceed with full response
-
-            with open(filepath, 'rb') as f:
-                content = f.read()
-            self.send_response(200)
-            self.send_header('Content-Type', content_type)
-            self.send_header('Content-Length', len(content))
-            self.send_header('Last-Modified', last_modified)
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(content)
+                    self.end_headers()
+                    sock.sendfile(f, 0, size)
+                finally:
+                    if _HAVE_TCP_CORK:
+                        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 0)
         except FileNotFoundError:
             self._send_json({"error": "Not found"}, 404)
-    
+
+    def _not_modified(self, etag: str, mtime: float) -> bool:
+        """Check the request's conditional headers against a file's validators.
+
+        If-None-Match takes precedence; If-Modified-Since is only consulted
+        when the client sent no entity tags.
+        """
+        inm = self.headers.get('If-None-Match')
+        if inm:
+            if inm.strip() == '*':
+                return True
+            return any(tag.strip().removeprefix('W/') == etag for tag in inm.split(','))
+
+        ims = self.headers.get('If-Modified-Since')
+        if ims:
+            try:
+                ims_time = email.utils.parsedate_to_datetime(ims)
+                file_time = datetime.fromtimestamp(mtime, tz=timezone.utc)
+                return file_time <= ims_time
+            except (ValueError, TypeError):
+                pass  # Invalid date format, proceed with full response
+        return False
+
     def _get_client_ip(self) -> str:
         """Get client IP address, preferring X-Forwarded-For for proxied requests."""
         return self.headers.get('X-Forwarded-For', self.client_address[0])
@@ -1127,7 +1946,7 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
             return False
 
         password = self.headers.get('X-Admin-Password', '')
-        if password != _admin_password:
+        if not password_matches(password, _admin_password_bytes):
             record_failed_auth(client_ip)
             log(f"[HTTP] Admin auth failed from {client_ip}")
             return False
@@ -1146,7 +1965,7 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
             return False
 
         password = self.headers.get('X-Manager-Password', '')
-        if password != _event_manager.manager_password:
+        if not password_matches(password, _event_manager.manager_password_bytes):
             record_failed_auth(client_ip)
             log(f"[HTTP] Manager auth failed from {client_ip}")
             return False
@@ -1170,7 +1989,7 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
             return False
 
         password = self.headers.get('X-Admin-Password', '')
-        if password != event.get('admin_password', ''):
+        if not password_matches(password, _event_manager.get_admin_password_bytes(eid)):
             record_failed_auth(client_ip)
             log(f"[HTTP] Event {eid} admin auth failed from {client_ip}")
             return False
@@ -1182,23 +2001,33 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Headers', 'X-Admin-Password, X-Manager-Password, Content-Type')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, PATCH, DELETE, OPTIONS')
+        self.send_header('Content-Length', '0')
         self.end_headers()
     
+    def _send_course(self, *course_files: Path | None):
+        """Send the first course file that exists, or {"course": None} if none do."""
+        for course_file in course_files:
+            if not course_file:
+                continue
+            try:
+                with open(course_file, 'rb') as f:
+                    course = json_loads(f.read())
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                self._send_json({"error": str(e)}, 500)
+                return
+            self._send_json(course)
+            return
+        self._send_json({"course": None})
+
     def do_GET(self):
         """Handle GET requests."""
         path = urlparse(self.path).path
         
         if path == '/api/course':
             # Return current course (public endpoint)
-            if _course_file and _course_file.exists():
-                try:
-                    with open(_course_file, 'r') as f:
-                        course = json.load(f)
-                    self._send_json(course)
-                except Exception as e:
-                    self._send_json({"error": str(e)}, 500)
-            else:
-                self._send_json({"course": None})
+            self._send_course(_course_file)
         
         elif path == '/api/auth/check':
             # Check if password is correct
@@ -1217,7 +2046,7 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
         elif path == '/api/events':
             # Return list of active events (public endpoint)
             if _event_manager:
-                self._send_json({"events": _event_manager.get_public_events()})
+                self._send_json_bytes(_event_manager.get_public_events_json())
             else:
                 # Legacy mode - return single default event
                 self._send_json({"events": [{"eid": 1, "name": "Default Event", "description": ""}]})
@@ -1228,7 +2057,7 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
                 self._send_json({"error": "Unauthorized"}, 401)
                 return
             if _event_manager:
-                self._send_json({"events": _event_manager.get_all_events()})
+                self._send_json_bytes(_event_manager.get_all_events_json())
             else:
                 self._send_json({"error": "Multi-event mode not enabled"}, 400)
 
@@ -1245,30 +2074,15 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
             # Security: prevent directory traversal
             try:
                 filepath = (_static_dir / path.lstrip('/')).resolve()
-                if not str(filepath).startswith(str(_static_dir.resolve())):
+                if not str(filepath).startswith(_static_root):
                     self._send_json({"error": "Forbidden"}, 403)
                     return
             except Exception:
                 self._send_json({"error": "Bad request"}, 400)
                 return
             
-            if filepath.exists() and filepath.is_file():
-                # Determine content type
-                ext = filepath.suffix.lower()
-                content_types = {
-                    '.html': 'text/html',
-                    '.css': 'text/css',
-                    '.js': 'application/javascript',
-                    '.json': 'application/json',
-                    '.jsonl': 'application/jsonlines',
-                    '.gz': 'application/gzip',
-                    '.png': 'image/png',
-                    '.jpg': 'image/jpeg',
-                    '.jpeg': 'image/jpeg',
-                    '.svg': 'image/svg+xml',
-                    '.ico': 'image/x-icon',
-                }
-                content_type = content_types.get(ext, 'application/octet-stream')
+            if filepath.is_file():
+                content_type = _STATIC_CONTENT_TYPES.get(filepath.suffix.lower(), 'application/octet-stream')
                 self._send_file(filepath, content_type)
             else:
                 self._send_json({"error": "Not found"}, 404)
@@ -1278,7 +2092,7 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
     def _parse_event_path(self, path: str) -> tuple[int | None, str]:
         """Parse /api/event/{eid}/... path. Returns (eid, remaining_path) or (None, '') on error."""
         # Pattern: /api/event/{eid}/...
-        match = re.match(r'^/api/event/(\d+)(/.*)?$', path)
+        match = _EVENT_PATH_RE.match(path)
         if not match:
             return None, ''
         eid = int(match.group(1))
@@ -1307,23 +2121,9 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
         if subpath == '/course':
             # Return course for this event (public)
             tracker = get_event_tracker(eid)
-            if tracker and tracker.course_file.exists():
-                try:
-                    with open(tracker.course_file, 'r') as f:
-                        course = json.load(f)
-                    self._send_json(course)
-                except Exception as e:
-                    self._send_json({"error": str(e)}, 500)
-            elif _course_file and _course_file.exists() and eid == 1:
-                # Fall back to legacy course file for event 1
-                try:
-                    with open(_course_file, 'r') as f:
-                        course = json.load(f)
-                    self._send_json(course)
-                except Exception as e:
-                    self._send_json({"error": str(e)}, 500)
-            else:
-                self._send_json({"course": None})
+            # Fall back to legacy course file for event 1
+            self._send_course(tracker.course_file if tracker else None,
+                              _course_file if eid == 1 else None)
 
         elif subpath == '/auth/check':
             # Check admin password for this event
@@ -1379,21 +2179,13 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
         elif subpath == '/admin/course':
             # Save course for this event
             try:
-                content_length = int(self.headers.get('Content-Length', 0))
-                body = self.rfile.read(content_length).decode('utf-8')
-                course = json.loads(body)
-                course['updated'] = time.time()
-                course['updated_iso'] = datetime.now().isoformat()
+                course = json_loads(self._read_body())
+                course['updated'], course['updated_iso'] = now_with_iso()
 
                 tracker = get_event_tracker(eid)
                 if tracker:
-                    # Rotate existing course before saving new one
-                    if tracker.course_file.exists():
-                        rotate_file(tracker.course_file)
-                    tmp_file = tracker.course_file.with_suffix('.tmp')
-                    with open(tmp_file, 'w') as f:
-                        json.dump(course, f, indent=2)
-                    tmp_file.rename(tracker.course_file)
+                    # Keep the existing course as .1, .2, etc.
+                    write_json_atomic(tracker.course_file, course, rotate=True)
                     log(f"[EVENT {eid}] Course saved: {len(course.get('marks', []))} marks")
                     self._send_json({"success": True})
                 else:
@@ -1412,9 +2204,7 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
                 return
 
             try:
-                content_length = int(self.headers.get('Content-Length', 0))
-                body = self.rfile.read(content_length).decode('utf-8')
-                data = json.loads(body)
+                data = json_loads(self._read_body())
 
                 tracker = get_event_tracker(eid)
                 if not tracker:
@@ -1431,14 +2221,9 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
 
                 if override:
                     tracker.user_overrides[user_id] = override
-                    save_user_overrides(tracker.users_file, tracker.user_overrides)
+                    request_user_overrides_save(tracker.users_file, tracker.user_overrides)
                     # Refresh positions file
-                    write_current_positions(
-                        tracker.position_tracker.current_positions,
-                        tracker.positions_file,
-                        tracker.user_overrides,
-                        tracker.position_tracker.position_tails
-                    )
+                    tracker.position_tracker.request_positions_write()
                     log(f"[EVENT {eid}] User override set for {user_id}: {override}")
                     self._send_json({"success": True, "user_id": user_id, "override": override})
                 else:
@@ -1462,9 +2247,7 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
                 return
 
             try:
-                content_length = int(self.headers.get('Content-Length', 0))
-                body = self.rfile.read(content_length).decode('utf-8')
-                data = json.loads(body)
+                data = json_loads(self._read_body())
 
                 # Validate required fields
                 if 'name' not in data or 'start_ts' not in data or 'end_ts' not in data:
@@ -1489,7 +2272,7 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
 
                 # Find the summary file for this log
                 # Extract date from log file name (e.g., 2025_01_15.jsonl -> 2025_01_15_summary.json)
-                date_match = re.match(r'^(\d{4}_\d{2}_\d{2})\.jsonl', log_file)
+                date_match = _LOG_DATE_RE.match(log_file)
                 if not date_match:
                     self._send_json({"error": "Invalid log file format"}, 400)
                     return
@@ -1528,11 +2311,8 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
                 # Sort sublogs by start time
                 log_entry['sublogs'].sort(key=lambda x: x.get('start_ts', 0))
 
-                # Save summary atomically
-                tmp_file = summary_file.with_suffix('.tmp')
-                with open(tmp_file, 'w') as f:
-                    json.dump(summary, f, indent=2)
-                tmp_file.rename(summary_file)
+                # Save summary
+                write_json_atomic(summary_file, summary)
 
                 log(f"[EVENT {eid}] Added sublog '{name}' to {log_file}")
                 self._send_json(summary)
@@ -1572,13 +2352,8 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
             tracker = get_event_tracker(eid)
             if tracker and user_id in tracker.user_overrides:
                 del tracker.user_overrides[user_id]
-                save_user_overrides(tracker.users_file, tracker.user_overrides)
-                write_current_positions(
-                    tracker.position_tracker.current_positions,
-                    tracker.positions_file,
-                    tracker.user_overrides,
-                    tracker.position_tracker.position_tails
-                )
+                request_user_overrides_save(tracker.users_file, tracker.user_overrides)
+                tracker.position_tracker.request_positions_write()
                 log(f"[EVENT {eid}] User override removed for {user_id}")
             self._send_json({"success": True, "user_id": user_id})
 
@@ -1606,7 +2381,7 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
                 return
 
             # Find the summary file for this log
-            date_match = re.match(r'^(\d{4}_\d{2}_\d{2})\.jsonl', log_file)
+            date_match = _LOG_DATE_RE.match(log_file)
             if not date_match:
                 self._send_json({"error": "Invalid log file format"}, 400)
                 return
@@ -1641,11 +2416,8 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
                 # Remove the sublog
                 removed = sublogs.pop(sublog_index)
 
-                # Save summary atomically
-                tmp_file = summary_file.with_suffix('.tmp')
-                with open(tmp_file, 'w') as f:
-                    json.dump(summary, f, indent=2)
-                tmp_file.rename(summary_file)
+                # Save summary
+                write_json_atomic(summary_file, summary)
 
                 log(f"[EVENT {eid}] Removed sublog '{removed.get('name', 'unnamed')}' from {log_file}")
                 self._send_json(summary)
@@ -1706,23 +2478,14 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
         elif path == '/api/admin/course':
             # Save course
             try:
-                content_length = int(self.headers.get('Content-Length', 0))
-                body = self.rfile.read(content_length).decode('utf-8')
-                course = json.loads(body)
+                course = json_loads(self._read_body())
 
                 # Add timestamp
-                course['updated'] = time.time()
-                course['updated_iso'] = datetime.now().isoformat()
+                course['updated'], course['updated_iso'] = now_with_iso()
 
                 if _course_file:
-                    # Rotate existing course before saving new one
-                    if _course_file.exists():
-                        rotate_file(_course_file)
-                    # Write atomically
-                    tmp_file = _course_file.with_suffix('.tmp')
-                    with open(tmp_file, 'w') as f:
-                        json.dump(course, f, indent=2)
-                    tmp_file.rename(_course_file)
+                    # Keep the existing course as .1, .2, etc.
+                    write_json_atomic(_course_file, course, rotate=True)
                     log(f"[ADMIN] Course saved: {len(course.get('marks', []))} marks")
                     self._send_json({"success": True})
                 else:
@@ -1740,9 +2503,7 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
                 self._send_json({"error": "User ID required"}, 400)
                 return
             try:
-                content_length = int(self.headers.get('Content-Length', 0))
-                body = self.rfile.read(content_length).decode('utf-8')
-                data = json.loads(body)
+                data = json_loads(self._read_body())
 
                 global _user_overrides
                 # Only allow name, role, and hidden overrides
@@ -1756,16 +2517,10 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
 
                 if override:
                     _user_overrides[user_id] = override
-                    if _users_file:
-                        save_user_overrides(_users_file, _user_overrides)
+                    request_user_overrides_save(_users_file, _user_overrides)
                     # Refresh current positions to apply the override
-                    if _position_tracker and _position_tracker.positions_file:
-                        write_current_positions(
-                            _position_tracker.current_positions,
-                            _position_tracker.positions_file,
-                            _user_overrides,
-                            _position_tracker.position_tails
-                        )
+                    if _position_tracker:
+                        _position_tracker.request_positions_write()
                     log(f"[ADMIN] User override set for {user_id}: {override}")
                     self._send_json({"success": True, "user_id": user_id, "override": override})
                 else:
@@ -1790,25 +2545,23 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
         recv_time = time.time()
 
         try:
-            content_length = int(self.headers.get('Content-Length', 0))
-            body = self.rfile.read(content_length).decode('utf-8')
-            packet = json.loads(body)
+            packet = json_loads(self._read_body())
 
             # Sanitize packet inputs
-            packet = sanitize_tracker_packet(packet)
-
-            # Extract fields with defaults (same as UDP handler)
-            sailor_id = packet.get("id", "???")
-            seq = packet.get("sq", 0)
-            ts = packet.get("ts", 0)
-            speed = packet.get("spd", 0.0)
-            heading = packet.get("hdg", 0)
-            assist = packet.get("ast", False)
-            battery = packet.get("bat", -1)
-            signal = packet.get("sig", -1)
+            sanitize_tracker_packet(packet)
+
+            # Extract fields (required ones are always set by sanitize_tracker_packet) (same as UDP handler)
+            sailor_id = packet["id"]
+            seq = packet["sq"]
+            ts = packet["ts"]
+            speed = packet["spd"]
+            heading = packet["hdg"]
+            assist = packet["ast"]
+            battery = packet["bat"]
+            signal = packet["sig"]
             heart_rate = packet.get("hr")  # Heart rate in bpm (optional, from Wear OS)
-            role = packet.get("role", "sailor")
-            version = packet.get("ver", "?")
+            role = packet["role"]
+            version = packet["ver"]
             flags = packet.get("flg", {})
             battery_drain_rate = packet.get("bdr")
             os_version = packet.get("os")  # OS version string (optional)
@@ -1816,38 +2569,37 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
             stopped = packet.get("stopped", False)  # User deliberately stopped tracking
 
             # Extract event ID (default to 1 for backwards compatibility)
-            eid = packet.get("eid", 1)
+            eid = packet["eid"]
 
             # Multi-event mode: look up event and check per-event password
             if _event_manager:
-                event = _event_manager.get_event(eid)
-                if not event:
+                event_info = _event_manager.get_packet_info(eid)
+                if not event_info:
                     log(f"[POST] Event {eid} not found for {sailor_id}")
-                    self._send_json({"ack": seq, "ts": int(recv_time), "error": "event", "msg": f"Event {eid} not found"}, 404)
+                    self._send_json_bytes(_ACK_EVENT_NOT_FOUND % (seq, int(recv_time), eid), 404)
                     return
-                if event.get('archived'):
+                if event_info.archived:
                     log(f"[POST] Event {eid} is archived, rejecting {sailor_id}")
-                    self._send_json({"ack": seq, "ts": int(recv_time), "error": "event", "msg": f"Event {eid} is archived"}, 400)
+                    self._send_json_bytes(_ACK_EVENT_ARCHIVED % (seq, int(recv_time), eid), 400)
                     return
 
                 # Check per-event tracker password
-                event_tracker_pwd = event.get('tracker_password', '')
-                if event_tracker_pwd:
+                if event_info.requires_tracker_password:
                     if is_rate_limited(client_ip):
                         log(f"[AUTH] Rate limited for {sailor_id} from {client_ip} os={os_version} ver={version}")
-                        self._send_json({"ack": seq, "ts": int(recv_time), "error": "auth", "msg": "Too many attempts"}, 429)
+                        self._send_json_bytes(_ACK_AUTH_RATE_LIMITED % (seq, int(recv_time)), 429)
                         return
                     packet_pwd = packet.get("pwd", "")
-                    if packet_pwd != event_tracker_pwd:
+                    if not password_matches(packet_pwd, event_info.tracker_password_bytes):
                         record_failed_auth(client_ip)
                         log(f"[AUTH] Failed for event {eid} user={sailor_id} pwd='{packet_pwd}' os={os_version} ver={version} from {client_ip}")
-                        self._send_json({"ack": seq, "ts": int(recv_time), "error": "auth", "msg": "Invalid password"}, 401)
+                        self._send_json_bytes(_ACK_AUTH_INVALID % (seq, int(recv_time)), 401)
                         return
 
                 # Check for auth-only request (no position update)
                 if packet.get("auth_check"):
                     log(f"[AUTH] Checkuser OK for event {eid} user={sailor_id} from {client_ip} os={os_version} ver={version}")
-                    self._send_json({"ack": seq, "ts": int(recv_time)})
+                    self._send_json_bytes(encode_ack(seq, int(recv_time)))
                     return
 
                 # Get or create the event tracker
@@ -1856,30 +2608,30 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
                     log(f"[POST] ERROR: Could not get tracker for event {eid}")
                     self._send_json({"error": "Could not initialize event tracker"}, 500)
                     return
-                event_name = event.get('name', f'Event {eid}')
-                assist_enabled = event.get('assist_enabled', True)
+                ack_suffix = event_info.ack_suffix
+                assist_enabled = event_info.assist_enabled
 
             else:
-                event_name = None  # No event name in legacy mode
+                ack_suffix = _PLAIN_ACK_SUFFIX  # No event name in legacy mode
                 assist_enabled = True  # Legacy mode always has assist enabled
                 # Legacy single-event mode
                 # Check rate limiting and password if required
                 if _tracker_password:
                     if is_rate_limited(client_ip):
                         log(f"[AUTH] Rate limited for {sailor_id} from {client_ip} os={os_version} ver={version}")
-                        self._send_json({"ack": seq, "ts": int(recv_time), "error": "auth", "msg": "Too many attempts"}, 429)
+                        self._send_json_bytes(_ACK_AUTH_RATE_LIMITED % (seq, int(recv_time)), 429)
                         return
                     packet_pwd = packet.get("pwd", "")
-                    if packet_pwd != _tracker_password:
+                    if not password_matches(packet_pwd, _tracker_password_bytes):
                         record_failed_auth(client_ip)
                         log(f"[AUTH] Failed (legacy) user={sailor_id} pwd='{packet_pwd}' os={os_version} ver={version} from {client_ip}")
-                        self._send_json({"ack": seq, "ts": int(recv_time), "error": "auth", "msg": "Invalid password"}, 401)
+                        self._send_json_bytes(_ACK_AUTH_INVALID % (seq, int(recv_time)), 401)
                         return
 
                 # Check for auth-only request (no position update) - legacy mode
                 if packet.get("auth_check"):
                     log(f"[AUTH] Checkuser OK (legacy) user={sailor_id} from {client_ip} os={os_version} ver={version}")
-                    self._send_json({"ack": seq, "ts": int(recv_time)})
+                    self._send_json_bytes(encode_ack(seq, int(recv_time)))
                     return
 
                 if not _position_tracker:
@@ -1890,14 +2642,14 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
 
             # Check for 1Hz array format vs single position
             pos_array = packet.get("pos")
-            if pos_array and isinstance(pos_array, list) and len(pos_array) > 0:
+            if pos_array and isinstance(pos_array, list):
                 last_pos = pos_array[-1]
                 lat = last_pos[1] if len(last_pos) > 1 else 0.0
                 lon = last_pos[2] if len(last_pos) > 2 else 0.0
                 ts = last_pos[0] if len(last_pos) > 0 else ts
             else:
-                lat = packet.get("lat", 0.0)
-                lon = packet.get("lon", 0.0)
+                lat = packet["lat"]
+                lon = packet["lon"]
 
             # Clear assist flag if assist is disabled for this event
             if not assist_enabled:
@@ -1931,29 +2683,10 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
                 # Legacy single-event mode
                 has_batch = pos_array and isinstance(pos_array, list) and len(pos_array) > 1
                 if has_batch and _daily_logger:
-                    track_entry = {
-                        "id": sailor_id,
-                        "ts": ts,
-                        "recv_ts": recv_time,
-                        "pos": pos_array,
-                        "spd": speed,
-                        "hdg": heading,
-                        "ast": assist,
-                        "bat": battery,
-                        "sig": signal,
-                        "role": role,
-                        "ver": version,
-                        "flg": flags
-                    }
-                    if battery_drain_rate is not None:
-                        track_entry["bdr"] = battery_drain_rate
-                    if heart_rate is not None and heart_rate > 0:
-                        track_entry["hr"] = heart_rate
-                    if os_version:
-                        track_entry["os"] = os_version
-                    if horizontal_accuracy is not None:
-                        track_entry["hac"] = horizontal_accuracy
-                    _daily_logger.write(track_entry)
+                    _daily_logger.write(build_track_entry(
+                        sailor_id, ts, recv_time, speed, heading, assist, battery, signal, role, version, flags,
+                        battery_drain_rate=battery_drain_rate, heart_rate=heart_rate, os_version=os_version,
+                        horizontal_accuracy=horizontal_accuracy, pos_array=pos_array))
 
                 _position_tracker.process_position(
                     sailor_id=sailor_id,
@@ -1980,12 +2713,7 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
                 )
 
             # Send ACK response (same format as UDP)
-            ack_response = {"ack": seq, "ts": int(recv_time)}
-            if event_name:
-                ack_response["event"] = event_name
-            if not assist_enabled:
-                ack_response["assist"] = False
-            self._send_json(ack_response)
+            self._send_json_bytes(encode_ack(seq, int(recv_time), ack_suffix))
 
         except json.JSONDecodeError as e:
             log(f"[POST] JSON PARSE ERROR from {client_ip}: {e}")
@@ -2006,11 +2734,10 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
         import os
 
         try:
-            content_length = int(self.headers.get('Content-Length', 0))
-            body = self.rfile.read(content_length)
+            body = self._read_body()
             content_type = self.headers.get('Content-Type', 'unknown')
 
-            log(f"[UDID] Received {content_length} bytes, Content-Type: {content_type}")
+            log(f"[UDID] Received {len(body)} bytes, Content-Type: {content_type}")
             log(f"[UDID] First 100 bytes: {body[:100]}")
 
             data = None
@@ -2022,7 +2749,15 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
             except Exception:
                 pass
 
-            # If that failed, try extracting from PKCS#7/CMS envelope using openssl
+            # If that failed, extract the plist from the PKCS#7/CMS envelope
+            if data is None:
+                try:
+                    data = plistlib.loads(extract_cms_content(body))
+                    log(f"[UDID] Parsed from CMS envelope")
+                except Exception as e:
+                    log(f"[UDID] In-process CMS parse failed: {e}")
+
+            # Fall back to openssl for encodings the parser above doesn't handle
             if data is None:
                 try:
                     with tempfile.NamedTemporaryFile(delete=False, suffix='.der') as f:
@@ -2049,6 +2784,7 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
                 log(f"[UDID] Could not parse plist from body")
                 self.send_response(302)
                 self.send_header('Location', '/install/flutter-ios.html?error=parse')
+                self.send_header('Content-Length', '0')
                 self.end_headers()
                 return
 
@@ -2065,6 +2801,7 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
 
             self.send_response(301)
             self.send_header('Location', redirect_url)
+            self.send_header('Content-Length', '0')
             self.end_headers()
 
         except Exception as e:
@@ -2073,14 +2810,13 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
             traceback.print_exc()
             self.send_response(302)
             self.send_header('Location', '/install/flutter-ios.html?error=unknown')
+            self.send_header('Content-Length', '0')
             self.end_headers()
 
     def _handle_create_event(self):
         """Handle event creation (manager endpoint)."""
         try:
-            content_length = int(self.headers.get('Content-Length', 0))
-            body = self.rfile.read(content_length).decode('utf-8')
-            data = json.loads(body)
+            data = json_loads(self._read_body())
 
             if not _event_manager:
                 self._send_json({"error": "Multi-event mode not enabled"}, 400)
@@ -2126,7 +2862,7 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
         path = urlparse(self.path).path
 
         # Manager endpoint - update event
-        match = re.match(r'^/api/manage/event/(\d+)$', path)
+        match = _MANAGE_EVENT_PATH_RE.match(path)
         if match:
             if not self._check_manager_auth():
                 self._send_json({"error": "Unauthorized"}, 401)
@@ -2134,9 +2870,7 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
 
             eid = int(match.group(1))
             try:
-                content_length = int(self.headers.get('Content-Length', 0))
-                body = self.rfile.read(content_length).decode('utf-8')
-                updates = json.loads(body)
+                updates = json_loads(self._read_body())
 
                 if not _event_manager:
                     self._send_json({"error": "Multi-event mode not enabled"}, 400)
@@ -2185,16 +2919,10 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
             global _user_overrides
             if user_id in _user_overrides:
                 del _user_overrides[user_id]
-                if _users_file:
-                    save_user_overrides(_users_file, _user_overrides)
+                request_user_overrides_save(_users_file, _user_overrides)
                 # Refresh current positions to remove the override
-                if _position_tracker and _position_tracker.positions_file:
-                    write_current_positions(
-                        _position_tracker.current_positions,
-                        _position_tracker.positions_file,
-                        _user_overrides,
-                        _position_tracker.position_tails
-                    )
+                if _position_tracker:
+                    _position_tracker.request_positions_write()
                 log(f"[ADMIN] User override removed for {user_id}")
             self._send_json({"success": True, "user_id": user_id})
 
@@ -2202,13 +2930,59 @@ class AdminHTTPHandler(BaseHTTPRequestHandler):
             self._send_json({"error": "Not found"}, 404)
 
 
-def run_http_server(port: int):
+def run_http_server(port: int, max_workers: int = 32):
     """Run HTTP server in a thread."""
-    server = ThreadingHTTPServer(('0.0.0.0', port), AdminHTTPHandler)
-    log(f"Admin HTTP server listening on port {port}")
+    server = BoundedThreadingHTTPServer(('0.0.0.0', port), AdminHTTPHandler, max_workers=max_workers)
+    log(f"Admin HTTP server listening on port {port} ({max_workers} workers)")
     server.serve_forever()
 
 
+def flush_pending_writes():
+    """Flush track logs, save queued user overrides, then rewrite positions files with pending changes."""
+    with _pending_writes_lock:
+        loggers = list(_pending_log_flushes)
+        _pending_log_flushes.clear()
+        user_saves = list(_pending_user_saves.items())
+        _pending_user_saves.clear()
+        trackers = list(_pending_position_writes)
+        _pending_position_writes.clear()
+    for daily_logger in loggers:
+        try:
+            daily_logger.flush()
+        except (OSError, ValueError) as e:
+            log(f"[WARNING] Failed to flush track log in {daily_logger.log_dir}: {e}")
+    for users_file, overrides in user_saves:
+        try:
+            save_user_overrides(users_file, overrides)
+        except Exception as e:
+            log(f"[WARNING] Failed to save user overrides to {users_file}: {e}")
+    # Each write is guarded on its own so one failing event can't drop the
+    # others' pending writes (the sets were already cleared above)
+    for tracker in trackers:
+        try:
+            tracker.write_positions()
+        except Exception as e:
+            log(f"[WARNING] Failed to write positions to {tracker.positions_file}: {e}")
+
+
+def run_background_writer(interval: float = _WRITE_FLUSH_INTERVAL):
+    """Background thread that writes positions and users files and flushes track logs for all events.
+
+    Packets and admin changes only queue a write. This thread wakes on the first
+    one, waits `interval` so a burst of changes across all events coalesces,
+    then writes each affected file once.
+    """
+    log(f"[WRITER] Background writer started (interval: {interval}s)")
+    while True:
+        _pending_writes_event.wait()
+        time.sleep(interval)
+        _pending_writes_event.clear()
+        try:
+            flush_pending_writes()
+        except Exception as e:
+            log(f"[WRITER] Error writing files: {e}")
+
+
 def run_summary_generator(log_dir: Path, interval: int = 60):
     """Background thread to periodically generate log summaries."""
     log(f"[SUMMARY] Background generator started (interval: {interval}s)")
@@ -2222,6 +2996,77 @@ def run_summary_generator(log_dir: Path, interval: int = 60):
         time.sleep(interval)
 
 
+# zlib level for the served log files: level 6 compresses JSON lines nearly as
+# well as 9 at a fraction of the CPU
+_LOG_GZIP_LEVEL = 6
+
+
+class IncrementalLogGzip:
+    """Incrementally gzipped copy of a growing .jsonl log plus its rolling live window.
+
+    Each update() reads and compresses only the complete lines appended since
+    the previous call. The full gzip is the output so far plus a flush of a copy
+    of the compressor, so it is always a single valid gzip member.
+    """
+
+    __slots__ = ('inode', 'offset', 'total_lines', '_compressor', '_compressed', '_live')
+
+    def __init__(self, inode: int):
+        self.inode = inode
+        self.offset = 0
+        self.total_lines = 0
+        self._compressor = zlib.compressobj(_LOG_GZIP_LEVEL, zlib.DEFLATED, 31)
+        self._compressed = bytearray()
+        # (ts, raw line) for entries inside the live window
+        self._live: list[tuple[int, bytes]] = []
+
+    def update(self, f_in, cutoff_ts: int) -> bool:
+        """Consume complete lines appended to f_in. Returns True if any were read."""
+        f_in.seek(self.offset)
+        data = f_in.read()
+        end = data.rfind(b'\n') + 1
+        if not end:
+            return False
+        data = data[:end]
+        self.offset += end
+        self._compressed += self._compressor.compress(data)
+        for line in data.splitlines(keepends=True):
+            self.total_lines += 1
+            try:
+                entry = json_loads(line)
+                # Check timestamp - use 'ts' field
+                entry_ts = entry.get('ts', 0)
+                if entry_ts >= cutoff_ts:
+                    self._live.append((entry_ts, line))
+            except json.JSONDecodeError:
+                pass
+        return True
+
+    def write_live(self, path: Path, cutoff_ts: int) -> tuple[int, int]:
+        """Write entries newer than cutoff_ts to path atomically. Returns (entries, bytes)."""
+        self._live = [item for item in self._live if item[0] >= cutoff_ts]
+        payload = gzip.compress(b''.join(line for _, line in self._live), compresslevel=_LOG_GZIP_LEVEL)
+        tmp_file = path.parent / f"{path.name}.tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_file, path)
+        return len(self._live), len(payload)
+
+    def write_full(self, path: Path) -> int:
+        """Write the whole log compressed to path atomically. Returns bytes written."""
+        trailer = self._compressor.copy().flush()
+        tmp_file = path.parent / f"{path.name}.tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(self._compressed)
+            f.write(trailer)
+        os.replace(tmp_file, path)
+        return len(self._compressed) + len(trailer)
+
+
+# IncrementalLogGzip inode for "today's log doesn't exist"
+_NO_LOG_INODE = -1
+
+
 def run_log_compressor(log_dir: Path, interval: int = 10, live_window_minutes: int = 20):
     """Background thread to compress log files for efficient serving.
 
@@ -2229,12 +3074,15 @@ def run_log_compressor(log_dir: Path, interval: int = 10, live_window_minutes: i
     1. YYYY_MM_DD_live.jsonl.gz - Rolling window of last `live_window_minutes` (for live tracking)
     2. YYYY_MM_DD.jsonl.gz - Full compressed log (for historical review)
 
+    Only lines appended since the previous pass are read and compressed; the
+    state is reset when the log is rotated or truncated. While today's log
+    doesn't exist (tracks were cleared), existing compressed files are emptied.
     Uses atomic writes (temp file + rename) for concurrent read safety.
     """
-    import gzip
 
     log(f"[COMPRESS] Background compressor started (interval: {interval}s, live window: {live_window_minutes}min)")
-    last_mtime: dict[str, float] = {}
+    state: IncrementalLogGzip | None = None
+    state_name = ""
 
     while True:
         try:
@@ -2243,114 +3091,356 @@ def run_log_compressor(log_dir: Path, interval: int = 10, live_window_minutes: i
             live_gz_file = log_dir / f"{today.strftime('%Y_%m_%d')}_live.jsonl.gz"
             full_gz_file = log_dir / f"{today.strftime('%Y_%m_%d')}.jsonl.gz"
 
-            if log_file.exists():
-                current_mtime = log_file.stat().st_mtime
-                cached_mtime = last_mtime.get(log_file.name, 0)
-
-                if current_mtime > cached_mtime:
+            try:
+                st = os.stat(log_file)
+            except FileNotFoundError:
+                st = None
+            if st is None:
+                # No log for today, e.g. it was just rotated away by a clear:
+                # once per day, replace .gz files left from before with empty ones
+                if state is None or state_name != log_file.name or state.inode != _NO_LOG_INODE:
+                    state = IncrementalLogGzip(_NO_LOG_INODE)
+                    state_name = log_file.name
+                    if live_gz_file.exists() or full_gz_file.exists():
+                        state.write_live(live_gz_file, 0)
+                        state.write_full(full_gz_file)
+                        log(f"[COMPRESS] {log_file.name} is gone, emptied its compressed logs")
+            # An idle log costs one stat() per pass: only open and read it if it grew
+            idle = (st is not None and state is not None and state_name == log_file.name and
+                    state.inode == st.st_ino and st.st_size == state.offset)
+            if st is not None and not idle:
+                with open(log_file, 'rb') as f_in:
+                    st = os.fstat(f_in.fileno())
+                    # Start over for a new day's log, or one that was rotated or truncated
+                    reset = (state is None or state_name != log_file.name or
+                             state.inode != st.st_ino or st.st_size < state.offset)
+                    if reset:
+                        state = IncrementalLogGzip(st.st_ino)
+                        state_name = log_file.name
                     cutoff_ts = int(time.time()) - (live_window_minutes * 60)
-                    live_lines = 0
-                    total_lines = 0
-
-                    # Generate rolling live file (last N minutes only)
-                    tmp_live = live_gz_file.parent / f"{live_gz_file.name}.tmp"
-                    with open(log_file, 'r') as f_in:
-                        with gzip.open(tmp_live, 'wt') as f_out:
-                            for line in f_in:
-                                total_lines += 1
-                                try:
-                                    entry = json.loads(line)
-                                    # Check timestamp - use 'ts' field or 'recv_ts'
-                                    entry_ts = entry.get('ts', 0)
-                                    if entry_ts >= cutoff_ts:
-                                        f_out.write(line)
-                                        live_lines += 1
-                                except json.JSONDecodeError:
-                                    pass
-                    tmp_live.rename(live_gz_file)
-
-                    # Generate full compressed file (for review page)
-                    tmp_full = full_gz_file.parent / f"{full_gz_file.name}.tmp"
-                    with open(log_file, 'rb') as f_in:
-                        with gzip.open(tmp_full, 'wb') as f_out:
-                            f_out.write(f_in.read())
-                    tmp_full.rename(full_gz_file)
-
-                    last_mtime[log_file.name] = current_mtime
-
-                    # Log stats
-                    orig_size = log_file.stat().st_size
-                    live_size = live_gz_file.stat().st_size
-                    full_size = full_gz_file.stat().st_size
-                    log(f"[COMPRESS] Updated: live={live_size:,}B ({live_lines}/{total_lines} entries), "
-                          f"full={full_size:,}B (from {orig_size:,}B)")
+
+                    if state.update(f_in, cutoff_ts) or reset:
+                        # Generate rolling live file (last N minutes only)
+                        live_lines, live_size = state.write_live(live_gz_file, cutoff_ts)
+                        # Generate full compressed file (for review page)
+                        full_size = state.write_full(full_gz_file)
+
+                        # Log stats
+                        log(f"[COMPRESS] Updated: live={live_size:,}B ({live_lines}/{state.total_lines} entries), "
+                              f"full={full_size:,}B (from {state.offset:,}B)")
 
         except Exception as e:
-            tb_lines = traceback.format_exc().strip().split('\n')[-3:]
             log(f"[COMPRESS] Error: {e}")
-            for tb_line in tb_lines:
-                log(f"[COMPRESS]   {tb_line}")
+            log_traceback("COMPRESS", e)
         time.sleep(interval)
 
 
-def run_midnight_clearer(event_manager: EventManager, check_interval: int = 60):
+def next_midnight(tz: ZoneInfo, now: float) -> float:
+    """Return the epoch time of the first midnight in tz after `now`."""
+    tomorrow = datetime.fromtimestamp(now, tz).date() + timedelta(days=1)
+    return datetime.combine(tomorrow, datetime.min.time(), tzinfo=tz).timestamp()
+
+
+def run_midnight_clearer(event_manager: EventManager, max_delay: int = 120, max_sleep: int = 300):
     """Background thread to clear tracks at midnight in each event's timezone.
 
-    Checks every `check_interval` seconds if any event has crossed midnight
-    in its configured timezone. If so, clears tracks for that event (rotating
-    log files so they can still be viewed in track review).
+    Keeps a min-heap of (next midnight, eid) and sleeps until the earliest one,
+    waking early when an event is created or updated so new events and
+    timezone changes are scheduled. Clears tracks for each event as its
+    midnight passes (rotating log files so they can still be viewed in track
+    review). A clear more than `max_delay` seconds late (e.g. after a suspend)
+    is skipped. Sleeps are capped at `max_sleep` to notice wall clock steps.
     """
-    log(f"[MIDNIGHT] Auto-clear service started (check interval: {check_interval}s)")
+    log(f"[MIDNIGHT] Auto-clear service started (max delay: {max_delay}s)")
 
-    # Track which date we last cleared for each event (to avoid multiple clears)
-    last_cleared_date: dict[int, date] = {}
+    heap: list[tuple[float, int]] = []
+    # eid -> (timezone name, scheduled midnight); heap entries not matching are stale
+    scheduled: dict[int, tuple[str, float]] = {}
+    resync = True
 
     while True:
         try:
-            for eid in event_manager.list_events():
-                event_info = event_manager.get_event(eid)
-                if not event_info:
-                    continue
-                tz_name = event_info.get('timezone', 'Australia/Sydney')
-
-                try:
-                    tz = ZoneInfo(tz_name)
-                except Exception:
-                    tz = ZoneInfo('Australia/Sydney')
-
-                # Get current date in event's timezone
-                now_in_tz = datetime.now(tz)
-                today_in_tz = now_in_tz.date()
+            now = time.time()
+
+            if resync:
+                # Clear before scanning: a change made during the scan sets it
+                # again and triggers another pass rather than being lost
+                event_manager.events_changed.clear()
+                for eid in event_manager.list_events():
+                    event_info = event_manager.get_event(eid)
+                    if not event_info:
+                        continue
+                    tz_name = event_info.get('timezone', 'Australia/Sydney')
+                    if eid in scheduled and scheduled[eid][0] == tz_name:
+                        continue
+                    due = next_midnight(get_zoneinfo(tz_name), now)
+                    scheduled[eid] = (tz_name, due)
+                    heapq.heappush(heap, (due, eid))
 
-                # Check if we've already cleared for today
-                if eid in last_cleared_date and last_cleared_date[eid] >= today_in_tz:
+            while heap and heap[0][0] <= now:
+                due, eid = heapq.heappop(heap)
+                if eid not in scheduled or scheduled[eid][1] != due:
                     continue
+                tz_name = scheduled[eid][0]
+                next_due = next_midnight(get_zoneinfo(tz_name), max(now, due + 1))
+                scheduled[eid] = (tz_name, next_due)
+                heapq.heappush(heap, (next_due, eid))
 
-                # Check if it's just after midnight (within first check_interval*2 seconds of the day)
-                seconds_since_midnight = now_in_tz.hour * 3600 + now_in_tz.minute * 60 + now_in_tz.second
-                if seconds_since_midnight < check_interval * 2:
-                    # It's just after midnight - clear tracks
-                    tracker = get_event_tracker(eid)
-                    if tracker:
-                        tracker.clear_tracks()
-                        last_cleared_date[eid] = today_in_tz
-                        log(f"[MIDNIGHT] Auto-cleared tracks for event {eid} ({event_info.get('name', 'Unknown')}) "
-                            f"at midnight {tz_name}")
+                if now - due > max_delay:
+                    log(f"[MIDNIGHT] Skipped clearing event {eid}: woke {now - due:.0f}s after midnight")
+                    continue
+                event_info = event_manager.get_event(eid)
+                tracker = get_event_tracker(eid)
+                if event_info and tracker:
+                    tracker.clear_tracks()
+                    log(f"[MIDNIGHT] Auto-cleared tracks for event {eid} ({event_info.get('name', 'Unknown')}) "
+                        f"at midnight {tz_name}")
 
         except Exception as e:
-            tb_lines = traceback.format_exc().strip().split('\n')[-3:]
             log(f"[MIDNIGHT] Error: {e}")
-            for tb_line in tb_lines:
-                log(f"[MIDNIGHT]   {tb_line}")
+            log_traceback("MIDNIGHT", e)
+
+        timeout = min(max_sleep, max(1.0, heap[0][0] - time.time())) if heap else max_sleep
+        resync = event_manager.events_changed.wait(timeout)
 
-        time.sleep(check_interval)
+
+def handle_udp_packet(sock: socket.socket, data: bytes, addr: tuple[str, int], log_fh=None,
+                      recv_time: float | None = None):
+    """Decode, authenticate, ACK and record one UDP tracker packet.
+
+    Errors are logged rather than raised so one bad packet can't stop the
+    receive loop.
+    """
+    if recv_time is None:
+        recv_time = time.time()
+    client_ip = addr[0]
+
+    try:
+        packet = json_loads(data)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        log(f"[{addr[0]}:{addr[1]}] Invalid packet: {e}")
+        return
+
+    # Wrap processing in try/except to prevent crash on bad data
+    try:
+        # Sanitize packet inputs
+        sanitize_tracker_packet(packet)
+
+        # Extract fields (required ones are always set by sanitize_tracker_packet)
+        sailor_id = packet["id"]
+        seq = packet["sq"]
+        ts = packet["ts"]
+        speed = packet["spd"]
+        heading = packet["hdg"]
+        assist = packet["ast"]
+        battery = packet["bat"]
+        signal = packet["sig"]
+        heart_rate = packet.get("hr")  # Heart rate in bpm (optional, from Wear OS)
+        role = packet["role"]
+        version = packet["ver"]
+        flags = packet.get("flg", {})
+        battery_drain_rate = packet.get("bdr")  # Battery drain rate %/hr
+        os_version = packet.get("os")  # OS version string (optional)
+        horizontal_accuracy = packet.get("hac")  # Horizontal accuracy in meters (optional)
+        stopped = packet.get("stopped", False)  # User deliberately stopped tracking
+
+        # Extract event ID (default to 1 for backwards compatibility)
+        eid = packet["eid"]
+
+        # Check for 1Hz array format vs old single position format
+        pos_array = packet.get("pos")  # [[ts, lat, lon], ...]
+        if pos_array and isinstance(pos_array, list):
+            # New 1Hz array format - use last position for live display
+            last_pos = pos_array[-1]
+            lat = last_pos[1] if len(last_pos) > 1 else 0.0
+            lon = last_pos[2] if len(last_pos) > 2 else 0.0
+            # Use timestamp from last position
+            ts = last_pos[0] if len(last_pos) > 0 else ts
+        else:
+            # Old single position format (backwards compatible)
+            lat = packet["lat"]
+            lon = packet["lon"]
+
+        # Multi-event mode: look up event and check per-event password
+        if _event_manager:
+            event_info = _event_manager.get_packet_info(eid)
+            if not event_info:
+                log(f"[UDP] Event {eid} not found for {sailor_id}")
+                error_ack = _ACK_EVENT_NOT_FOUND % (seq, int(recv_time), eid)
+                sock.sendto(error_ack, addr)
+                return
+            if event_info.archived:
+                log(f"[UDP] Event {eid} is archived, rejecting {sailor_id}")
+                error_ack = _ACK_EVENT_ARCHIVED % (seq, int(recv_time), eid)
+                sock.sendto(error_ack, addr)
+                return
+
+            # Check per-event tracker password
+            if event_info.requires_tracker_password:
+                if is_rate_limited(client_ip):
+                    log(f"[UDP] Auth rate-limited for {sailor_id} from {client_ip}")
+                    error_ack = _ACK_AUTH_INVALID % (seq, int(recv_time))
+                    sock.sendto(error_ack, addr)
+                    return
+                packet_pwd = packet.get("pwd", "")
+                if not password_matches(packet_pwd, event_info.tracker_password_bytes):
+                    record_failed_auth(client_ip)
+                    log(f"[UDP] Auth failed for {sailor_id} (event {eid}) from {client_ip} pwd='{packet_pwd}'")
+                    error_ack = _ACK_AUTH_INVALID % (seq, int(recv_time))
+                    sock.sendto(error_ack, addr)
+                    return
+
+            # Get or create the event tracker
+            event_tracker = get_event_tracker(eid)
+            if not event_tracker:
+                log(f"[UDP] ERROR: Could not get tracker for event {eid}")
+                error_ack = _ACK_TRACKER_UNAVAILABLE % (seq, int(recv_time))
+                sock.sendto(error_ack, addr)
+                return
+
+            # Send ACK with event name and assist status
+            assist_enabled = event_info.assist_enabled
+            sock.sendto(encode_ack(seq, int(recv_time), event_info.ack_suffix), addr)
+
+            # Clear assist flag if assist is disabled for this event
+            if not assist_enabled:
+                assist = False
+
+            # Process through event tracker
+            event_tracker.process_position(
+                sailor_id=sailor_id,
+                lat=lat,
+                lon=lon,
+                speed=speed,
+                heading=heading,
+                ts=ts,
+                assist=assist,
+                battery=battery,
+                signal=signal,
+                role=role,
+                version=version,
+                flags=flags,
+                src_ip=client_ip,
+                source="UDP",
+                battery_drain_rate=battery_drain_rate,
+                heart_rate=heart_rate,
+                os_version=os_version,
+                horizontal_accuracy=horizontal_accuracy,
+                pos_array=pos_array,
+                stopped=stopped
+            )
+
+        else:
+            # Legacy single-event mode
+            # Check rate limiting and password if required
+            if _tracker_password:
+                if is_rate_limited(client_ip):
+                    log(f"[UDP] Auth rate-limited for {sailor_id} from {client_ip}")
+                    error_ack = _ACK_AUTH_INVALID % (seq, int(recv_time))
+                    sock.sendto(error_ack, addr)
+                    return
+
+                packet_pwd = packet.get("pwd", "")
+                if not password_matches(packet_pwd, _tracker_password_bytes):
+                    record_failed_auth(client_ip)
+                    log(f"[UDP] Auth failed for {sailor_id} from {client_ip} pwd='{packet_pwd}'")
+                    error_ack = _ACK_AUTH_INVALID % (seq, int(recv_time))
+                    sock.sendto(error_ack, addr)
+                    return
+
+            # Send ACK
+            sock.sendto(encode_ack(seq, int(recv_time)), addr)
+
+            # If 1Hz array format, log as single entry with pos array (more compact)
+            has_batch = pos_array and isinstance(pos_array, list) and len(pos_array) > 1
+            if has_batch and _daily_logger:
+                _daily_logger.write(build_track_entry(
+                    sailor_id, ts, recv_time, speed, heading, assist, battery, signal, role, version, flags,
+                    battery_drain_rate=battery_drain_rate, heart_rate=heart_rate, os_version=os_version,
+                    horizontal_accuracy=horizontal_accuracy, pos_array=pos_array))
+
+            # Process position through shared tracker (updates live display)
+            # skip_log if we already logged the batch above
+            _position_tracker.process_position(
+                sailor_id=sailor_id,
+                lat=lat,
+                lon=lon,
+                speed=speed,
+                heading=heading,
+                ts=ts,
+                assist=assist,
+                battery=battery,
+                signal=signal,
+                role=role,
+                version=version,
+                flags=flags,
+                src_ip=client_ip,
+                source="UDP",
+                battery_drain_rate=battery_drain_rate,
+                heart_rate=heart_rate,
+                os_version=os_version,
+                horizontal_accuracy=horizontal_accuracy,
+                skip_log=has_batch,
+                stopped=stopped,
+                pos_array=pos_array
+            )
+
+        # Write to legacy log file (JSON lines format for easy parsing later).
+        # The receive fields are spliced in front of the encoded packet rather
+        # than copying the packet into a merged dict.
+        if log_fh is not None:
+            header = json_dumps({"recv_ts": recv_time, "src_ip": addr[0], "src_port": addr[1]})
+            log_fh.write(header[:-1] + b"," + json_dumps(packet)[1:] + b"\n")
+
+    except Exception as e:
+        log(f"[UDP] Error from {client_ip}: {e}")
+        log_traceback("UDP", e)
+
+
+# Kernel receive buffer requested for the UDP socket, to absorb bursts
+_UDP_RCVBUF_BYTES = 4 * 1024 * 1024
+
+# Datagrams received but not yet processed; beyond this the oldest are dropped
+_UDP_QUEUE_SIZE = 4096
+_UDP_DROP_LOG_INTERVAL = 10.0
+
+# Legacy log buffering: flushed when the queue drains, or at least this often
+_LEGACY_LOG_BUFFER_BYTES = 64 * 1024
+_LEGACY_LOG_FLUSH_INTERVAL = 1.0
+
+
+def _raise_keyboard_interrupt(signum, frame):
+    """SIGTERM handler: shut down like Ctrl-C so buffered logs and pending writes are flushed."""
+    raise KeyboardInterrupt
+
+
+def run_udp_worker(sock: socket.socket, packet_queue: queue.Queue, log_fh=None):
+    """Process queued datagrams until a None sentinel is received.
+
+    Runs on its own thread so slow disk writes delay processing, not
+    reception, and the kernel socket buffer keeps draining. The legacy log
+    is flushed once a burst has been worked through rather than per packet.
+    """
+    last_flush = time.monotonic()
+    while True:
+        item = packet_queue.get()
+        if item is None:
+            return
+        data, addr, recv_time = item
+        handle_udp_packet(sock, data, addr, log_fh, recv_time)
+        if log_fh:
+            now = time.monotonic()
+            if packet_queue.empty() or now - last_flush >= _LEGACY_LOG_FLUSH_INTERVAL:
+                log_fh.flush()
+                last_flush = now
 
 
 def run_server(port: int, log_file: Path | None, positions_file: Path | None, log_dir: Path | None,
                http_port: int | None = None, admin_password: str = "admin", course_file: Path | None = None,
                static_dir: Path | None = None,
                users_file: Path | None = None, tracker_password: str | None = None,
-               manager_password: str | None = None, events_file: Path | None = None):
+               manager_password: str | None = None, events_file: Path | None = None,
+               http_workers: int = 32):
     """Main server loop.
 
     If manager_password is provided, runs in multi-event mode where:
@@ -2360,15 +3450,22 @@ def run_server(port: int, log_file: Path | None, positions_file: Path | None, lo
 
     Otherwise, runs in legacy single-event mode with global passwords.
     """
-    global _daily_logger, _position_tracker, _admin_password, _tracker_password
-    global _course_file, _static_dir, _positions_file, _users_file, _user_overrides
+    global _daily_logger, _position_tracker, _admin_password, _admin_password_bytes
+    global _tracker_password, _tracker_password_bytes
+    global _course_file, _static_dir, _static_root, _positions_file, _users_file, _user_overrides
     global _event_manager
 
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    # The kernel caps this at net.core.rmem_max (Linux), so report what was granted
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _UDP_RCVBUF_BYTES)
+    except OSError as e:
+        log(f"[WARNING] Could not set UDP receive buffer: {e}")
     sock.bind(("0.0.0.0", port))
 
-    log(f"Tracker server listening on UDP port {port}")
+    rcvbuf = sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+    log(f"Tracker server listening on UDP port {port} (receive buffer {rcvbuf // 1024} KiB)")
     log("Waiting for packets...")
 
     # Multi-event mode initialization
@@ -2389,8 +3486,11 @@ def run_server(port: int, log_file: Path | None, positions_file: Path | None, lo
         # In multi-event mode, legacy globals are not used for data
         # but we still need static_dir for serving files
         _static_dir = static_dir
+        _static_root = os.path.join(static_dir.resolve(), "") if static_dir else ""
         _admin_password = ""  # Not used in multi-event mode
+        _admin_password_bytes = encode_password(_admin_password)
         _tracker_password = None
+        _tracker_password_bytes = None
         _course_file = None
         _positions_file = None
         _users_file = None
@@ -2420,7 +3520,7 @@ def run_server(port: int, log_file: Path | None, positions_file: Path | None, lo
             log(f"Users file: {users_file} ({len(user_overrides)} overrides)")
 
         # Create position tracker
-        position_tracker = PositionTracker(positions_file, daily_logger)
+        position_tracker = PositionTracker(positions_file, daily_logger, user_overrides)
 
         # Ensure current_positions.json exists (so web client doesn't get 404 on startup)
         if positions_file and not positions_file.exists():
@@ -2431,9 +3531,12 @@ def run_server(port: int, log_file: Path | None, positions_file: Path | None, lo
         _daily_logger = daily_logger
         _position_tracker = position_tracker
         _admin_password = admin_password
+        _admin_password_bytes = encode_password(admin_password)
         _tracker_password = tracker_password
+        _tracker_password_bytes = encode_password(tracker_password)
         _course_file = course_file
         _static_dir = static_dir
+        _static_root = os.path.join(static_dir.resolve(), "") if static_dir else ""
         _positions_file = positions_file
         _users_file = users_file
         _user_overrides = user_overrides
@@ -2451,9 +3554,13 @@ def run_server(port: int, log_file: Path | None, positions_file: Path | None, lo
         if _event_manager:
             log(f"Multi-event API: http://SERVER:{http_port}/api/events")
 
+    # Start the shared positions/users file writer
+    writer_thread = threading.Thread(target=run_background_writer, daemon=True, name="file-writer")
+    writer_thread.start()
+
     # Start HTTP server if enabled
     if http_port:
-        http_thread = threading.Thread(target=run_http_server, args=(http_port,), daemon=True)
+        http_thread = threading.Thread(target=run_http_server, args=(http_port, http_workers), daemon=True)
         http_thread.start()
 
     # Start background summary generator if track logging is enabled
@@ -2498,234 +3605,63 @@ def run_server(port: int, log_file: Path | None, positions_file: Path | None, lo
     # Open legacy log file if specified
     log_fh = None
     if log_file:
-        log_fh = open(log_file, "a")
+        log_fh = open(log_file, "ab", buffering=_LEGACY_LOG_BUFFER_BYTES)
         log(f"Legacy log: {log_file}")
 
+    # systemd stops the service with SIGTERM; route it through the same cleanup as Ctrl-C
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+
+    # This thread only receives; a worker does the decoding, disk writes and ACKs
+    packet_queue: queue.Queue = queue.Queue(maxsize=_UDP_QUEUE_SIZE)
+    udp_worker = threading.Thread(target=run_udp_worker, args=(sock, packet_queue, log_fh),
+                                  daemon=True, name="udp-worker")
+    udp_worker.start()
+    dropped = 0
+    last_drop_log = 0.0
+    rejected = 0
+    last_reject_log = 0.0
+
     try:
         while True:
             # Increased buffer size to 4096 to handle 1Hz mode packets with 10 positions
             data, addr = sock.recvfrom(4096)
             recv_time = time.time()
-            client_ip = addr[0]
-
-            try:
-                packet = json.loads(data.decode("utf-8"))
-            except (json.JSONDecodeError, UnicodeDecodeError) as e:
-                log(f"[{addr[0]}:{addr[1]}] Invalid packet: {e}")
+            # Tracker packets are JSON objects; drop port-scan and other junk
+            # here so it never takes a queue slot from a real position
+            if not data.startswith(b'{'):
+                rejected += 1
+                if recv_time - last_reject_log >= _UDP_DROP_LOG_INTERVAL:
+                    log(f"[UDP] Ignored {rejected} non-JSON datagrams (last from {addr[0]}:{addr[1]})")
+                    rejected = 0
+                    last_reject_log = recv_time
                 continue
-
-            # Wrap processing in try/except to prevent crash on bad data
             try:
-                # Sanitize packet inputs
-                packet = sanitize_tracker_packet(packet)
-
-                # Extract fields with defaults
-                sailor_id = packet.get("id", "???")
-                seq = packet.get("sq", 0)
-                ts = packet.get("ts", 0)
-                speed = packet.get("spd", 0.0)
-                heading = packet.get("hdg", 0)
-                assist = packet.get("ast", False)
-                battery = packet.get("bat", -1)
-                signal = packet.get("sig", -1)
-                heart_rate = packet.get("hr")  # Heart rate in bpm (optional, from Wear OS)
-                role = packet.get("role", "sailor")
-                version = packet.get("ver", "?")
-                flags = packet.get("flg", {})
-                battery_drain_rate = packet.get("bdr")  # Battery drain rate %/hr
-                os_version = packet.get("os")  # OS version string (optional)
-                horizontal_accuracy = packet.get("hac")  # Horizontal accuracy in meters (optional)
-                stopped = packet.get("stopped", False)  # User deliberately stopped tracking
-
-                # Extract event ID (default to 1 for backwards compatibility)
-                eid = packet.get("eid", 1)
-
-                # Check for 1Hz array format vs old single position format
-                pos_array = packet.get("pos")  # [[ts, lat, lon], ...]
-                if pos_array and isinstance(pos_array, list) and len(pos_array) > 0:
-                    # New 1Hz array format - use last position for live display
-                    last_pos = pos_array[-1]
-                    lat = last_pos[1] if len(last_pos) > 1 else 0.0
-                    lon = last_pos[2] if len(last_pos) > 2 else 0.0
-                    # Use timestamp from last position
-                    ts = last_pos[0] if len(last_pos) > 0 else ts
-                else:
-                    # Old single position format (backwards compatible)
-                    lat = packet.get("lat", 0.0)
-                    lon = packet.get("lon", 0.0)
-
-                # Multi-event mode: look up event and check per-event password
-                if _event_manager:
-                    event = _event_manager.get_event(eid)
-                    if not event:
-                        log(f"[UDP] Event {eid} not found for {sailor_id}")
-                        error_ack = json.dumps({"ack": seq, "ts": int(recv_time), "error": "event", "msg": f"Event {eid} not found"}).encode("utf-8")
-                        sock.sendto(error_ack, addr)
-                        continue
-                    if event.get('archived'):
-                        log(f"[UDP] Event {eid} is archived, rejecting {sailor_id}")
-                        error_ack = json.dumps({"ack": seq, "ts": int(recv_time), "error": "event", "msg": f"Event {eid} is archived"}).encode("utf-8")
-                        sock.sendto(error_ack, addr)
-                        continue
-
-                    # Check per-event tracker password
-                    event_tracker_pwd = event.get('tracker_password', '')
-                    if event_tracker_pwd:
-                        if is_rate_limited(client_ip):
-                            log(f"[UDP] Auth rate-limited for {sailor_id} from {client_ip}")
-                            error_ack = json.dumps({"ack": seq, "ts": int(recv_time), "error": "auth", "msg": "Invalid password"}).encode("utf-8")
-                            sock.sendto(error_ack, addr)
-                            continue
-                        packet_pwd = packet.get("pwd", "")
-                        if packet_pwd != event_tracker_pwd:
-                            record_failed_auth(client_ip)
-                            log(f"[UDP] Auth failed for {sailor_id} (event {eid}) from {client_ip} pwd='{packet_pwd}'")
-                            error_ack = json.dumps({"ack": seq, "ts": int(recv_time), "error": "auth", "msg": "Invalid password"}).encode("utf-8")
-                            sock.sendto(error_ack, addr)
-                            continue
-
-                    # Get or create the event tracker
-                    event_tracker = get_event_tracker(eid)
-                    if not event_tracker:
-                        log(f"[UDP] ERROR: Could not get tracker for event {eid}")
-                        error_ack = json.dumps({"ack": seq, "ts": int(recv_time), "error": "server", "msg": "Could not initialize event tracker"}).encode("utf-8")
-                        sock.sendto(error_ack, addr)
-                        continue
-
-                    # Send ACK with event name and assist status
-                    event_name = event.get('name', f'Event {eid}')
-                    assist_enabled = event.get('assist_enabled', True)
-                    ack_data = {"ack": seq, "ts": int(recv_time), "event": event_name}
-                    if not assist_enabled:
-                        ack_data["assist"] = False
-                    ack = json.dumps(ack_data).encode("utf-8")
-                    sock.sendto(ack, addr)
-
-                    # Clear assist flag if assist is disabled for this event
-                    if not assist_enabled:
-                        assist = False
-
-                    # Process through event tracker
-                    event_tracker.process_position(
-                        sailor_id=sailor_id,
-                        lat=lat,
-                        lon=lon,
-                        speed=speed,
-                        heading=heading,
-                        ts=ts,
-                        assist=assist,
-                        battery=battery,
-                        signal=signal,
-                        role=role,
-                        version=version,
-                        flags=flags,
-                        src_ip=client_ip,
-                        source="UDP",
-                        battery_drain_rate=battery_drain_rate,
-                        heart_rate=heart_rate,
-                        os_version=os_version,
-                        horizontal_accuracy=horizontal_accuracy,
-                        pos_array=pos_array,
-                        stopped=stopped
-                    )
-
-                else:
-                    # Legacy single-event mode
-                    # Check rate limiting and password if required
-                    if tracker_password:
-                        if is_rate_limited(client_ip):
-                            log(f"[UDP] Auth rate-limited for {sailor_id} from {client_ip}")
-                            error_ack = json.dumps({"ack": seq, "ts": int(recv_time), "error": "auth", "msg": "Invalid password"}).encode("utf-8")
-                            sock.sendto(error_ack, addr)
-                            continue
-
-                        packet_pwd = packet.get("pwd", "")
-                        if packet_pwd != tracker_password:
-                            record_failed_auth(client_ip)
-                            log(f"[UDP] Auth failed for {sailor_id} from {client_ip} pwd='{packet_pwd}'")
-                            error_ack = json.dumps({"ack": seq, "ts": int(recv_time), "error": "auth", "msg": "Invalid password"}).encode("utf-8")
-                            sock.sendto(error_ack, addr)
-                            continue
-
-                    # Send ACK
-                    ack = json.dumps({"ack": seq, "ts": int(recv_time)}).encode("utf-8")
-                    sock.sendto(ack, addr)
-
-                    # If 1Hz array format, log as single entry with pos array (more compact)
-                    has_batch = pos_array and isinstance(pos_array, list) and len(pos_array) > 1
-                    if has_batch and daily_logger:
-                        track_entry = {
-                            "id": sailor_id,
-                            "ts": ts,  # timestamp of last position (for sorting)
-                            "recv_ts": recv_time,
-                            "pos": pos_array,  # [[ts, lat, lon], ...] - compact array format
-                            "spd": speed,
-                            "hdg": heading,
-                            "ast": assist,
-                            "bat": battery,
-                            "sig": signal,
-                            "role": role,
-                            "ver": version,
-                            "flg": flags
-                        }
-                        if battery_drain_rate is not None:
-                            track_entry["bdr"] = battery_drain_rate
-                        if heart_rate is not None and heart_rate > 0:
-                            track_entry["hr"] = heart_rate
-                        if os_version:
-                            track_entry["os"] = os_version
-                        if horizontal_accuracy is not None:
-                            track_entry["hac"] = horizontal_accuracy
-                        daily_logger.write(track_entry)
-
-                    # Process position through shared tracker (updates live display)
-                    # skip_log if we already logged the batch above
-                    position_tracker.process_position(
-                        sailor_id=sailor_id,
-                        lat=lat,
-                        lon=lon,
-                        speed=speed,
-                        heading=heading,
-                        ts=ts,
-                        assist=assist,
-                        battery=battery,
-                        signal=signal,
-                        role=role,
-                        version=version,
-                        flags=flags,
-                        src_ip=client_ip,
-                        source="UDP",
-                        battery_drain_rate=battery_drain_rate,
-                        heart_rate=heart_rate,
-                        os_version=os_version,
-                        horizontal_accuracy=horizontal_accuracy,
-                        skip_log=has_batch,
-                        stopped=stopped,
-                        pos_array=pos_array
-                    )
-
-                # Write to legacy log file (JSON lines format for easy parsing later)
-                if log_fh:
-                    log_entry = {
-                        "recv_ts": recv_time,
-                        "src_ip": addr[0],
-                        "src_port": addr[1],
-                        **packet
-                    }
-                    log_fh.write(json.dumps(log_entry) + "\n")
-                    log_fh.flush()
-
-            except Exception as e:
-                tb_lines = traceback.format_exc().strip().split('\n')[-3:]
-                log(f"[UDP] Error from {client_ip}: {e}")
-                for tb_line in tb_lines:
-                    log(f"[UDP]   {tb_line}")
-                continue
+                packet_queue.put_nowait((data, addr, recv_time))
+            except queue.Full:
+                # Worker is behind: drop the oldest datagram, newer positions matter more
+                try:
+                    packet_queue.get_nowait()
+                except queue.Empty:
+                    pass
+                packet_queue.put_nowait((data, addr, recv_time))
+                dropped += 1
+                if recv_time - last_drop_log >= _UDP_DROP_LOG_INTERVAL:
+                    log(f"[UDP] Processing queue full, dropped {dropped} old packets")
+                    dropped = 0
+                    last_drop_log = recv_time
 
     except KeyboardInterrupt:
         log("Shutting down...")
     finally:
+        # Let the worker finish what is queued before the socket and logs close
+        try:
+            packet_queue.put(None, timeout=5)
+        except queue.Full:
+            pass
+        udp_worker.join(timeout=5)
         sock.close()
+        flush_pending_writes()
         if log_fh:
             log_fh.close()
         if daily_logger:
@@ -2745,6 +3681,7 @@ def load_settings(settings_file: Path = Path("settings.json")) -> dict:
         "users_file": "users.json",
         "course_file": "course.json",
         "http_port": None,
+        "http_workers": 32,
         "no_http": False,
         "no_track_logs": False,
     }
@@ -2810,6 +3747,12 @@ def main():
         default=None,
         help="HTTP port for admin API (default: same as UDP port)"
     )
+    parser.add_argument(
+        "--http-workers",
+        type=int,
+        default=None,
+        help=f"Number of HTTP worker threads (default: {settings['http_workers']})"
+    )
     parser.add_argument(
         "--no-http",
         action="store_true",
@@ -2882,6 +3825,7 @@ def main():
     no_http = args.no_http if args.no_http is not None else settings.get('no_http', False)
     no_track_logs = args.no_track_logs if args.no_track_logs is not None else settings.get('no_track_logs', False)
     http_port_setting = args.http_port if args.http_port else settings.get('http_port')
+    http_workers = args.http_workers if args.http_workers else settings['http_workers']
 
     # If data-dir specified, make paths relative to it
     if args.data_dir:
@@ -2900,6 +3844,8 @@ def main():
     positions_file = None if args.no_current else current_file
     log_dir_final = None if no_track_logs else log_dir
     http_port = None if no_http else (http_port_setting or port)
+    if http_workers < 1:
+        parser.error("http_workers must be at least 1")
 
     # Multi-event mode vs legacy mode password requirements
     if manager_password:
@@ -2917,7 +3863,8 @@ def main():
                users_file=users_file,
                tracker_password=tracker_password,
                manager_password=manager_password,
-               events_file=events_file)
+               events_file=events_file,
+               http_workers=http_workers)
 
 
 if __name__ == "__main__":